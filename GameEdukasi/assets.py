@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+
+# Waktu saat modul ini pertama kali di-import (dipakai sebagai awal startup)
+PROCESS_START = time.perf_counter()
+
+
+class AssetManager:
+    """
+    Memuat asset (suara, musik, gambar) hanya saat pertama kali dibutuhkan.
+    Asset yang sudah dimuat di-cache sehingga restart tidak memuat ulang.
+    preload() memuat asset di thread latar belakang (misalnya selama menu
+    tampil), sehingga get() nanti langsung mengembalikan hasil dari cache.
+    mark() mencatat waktu sejak PROCESS_START untuk mengukur cold start;
+    set GAME_STARTUP_REPORT=1 untuk mencetaknya saat frame pertama tampil.
+    """
+
+    def __init__(self, start_time=PROCESS_START):
+        self.start_time = start_time
+        self.timings = {}  # label -> detik sejak start_time
+        self.load_times = {}  # nama asset -> detik untuk memuat
+        self._loaders = {}
+        self._cache = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader):
+        """Daftarkan fungsi pemuat asset (tanpa langsung memuat)."""
+        self._loaders[name] = loader
+        self._locks[name] = threading.Lock()
+
+    def get(self, name):
+        """Asset dari cache, atau dimuat sekarang jika belum. None jika gagal dimuat."""
+        if name in self._cache:
+            return self._cache[name]
+        with self._locks[name]:
+            # Thread preload mungkin sudah selesai memuat selagi kita menunggu lock
+            if name not in self._cache:
+                start = time.perf_counter()
+                try:
+                    asset = self._loaders[name]()
+                except Exception as e:
+                    print(f"Error loading {name}:", e)
+                    asset = None
+                self.load_times[name] = time.perf_counter() - start
+                self._cache[name] = asset
+        return self._cache[name]
+
+    def preload(self, names=None):
+        """Muat asset yang belum dimuat di thread latar belakang."""
+        names = [n for n in (names or list(self._loaders)) if n not in self._cache]
+        if not names:
+            return None
+        thread = threading.Thread(target=lambda: [self.get(n) for n in names],
+                                  name="asset-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def mark(self, label):
+        """Catat waktu sejak start untuk label ini (hanya yang pertama kali)."""
+        with self._lock:
+            if label in self.timings:
+                return
+            self.timings[label] = time.perf_counter() - self.start_time
+        if label == "first_frame" and os.environ.get("GAME_STARTUP_REPORT", "0") not in ("", "0"):
+            print(self.report())
+
+    def report(self):
+        parts = [f"{label}={seconds * 1000:.0f}ms" for label, seconds in self.timings.items()]
+        parts += [f"load:{name}={seconds * 1000:.0f}ms" for name, seconds in self.load_times.items()]
+        return "Startup: " + ", ".join(parts)
@@ -0,0 +1,92 @@
+"""
+Benchmark cek tabrakan pemain vs lingkaran: brute force vs broad-phase.
+
+Membandingkan:
+  reference  - loop Python circle_rectangle_collision() per dict (versi asli)
+  numpy      - ObstaclePool.collision_mask() untuk semua lingkaran
+  y-band     - ObstaclePool.collides() dengan broad-phase pita-y
+  grid       - UniformGrid.build() + query() + cek kandidat
+
+Contoh:
+    python bench_collision.py --counts 100 10000 100000
+"""
+import argparse
+import random
+import timeit
+
+import numpy as np
+import pygame
+
+from broadphase import UniformGrid
+from obstacles import ObstaclePool
+
+
+def circle_rectangle_collision(circle, rect):
+    """Versi asli dari Game_Edukasi.py: titik terdekat pada persegi ke pusat lingkaran."""
+    cx, cy = circle['x'], circle['y']
+    r = circle['radius']
+    closest_x = max(rect.left, min(cx, rect.right))
+    closest_y = max(rect.top, min(cy, rect.bottom))
+    return (cx - closest_x) ** 2 + (cy - closest_y) ** 2 < r ** 2
+
+
+def make_field(count, clear_left, clear_right, width=580, height=600, radius=20, seed=1):
+    """
+    Lingkaran tersebar di atas dan di dalam layar, terurut seperti hasil spawn engine.
+    Kolom clear_left..clear_right dikosongkan agar pemain tidak tertabrak: ini kasus
+    paling umum (dan terburuk untuk brute force karena tidak ada early exit).
+    """
+    rng = random.Random(seed)
+    pool = ObstaclePool()
+    dicts = []
+    ys = sorted((rng.uniform(-height * 4, height) for _ in range(count)), reverse=True)
+    for y in ys:
+        x = rng.randint(radius, width - radius)
+        while clear_left - radius <= x <= clear_right + radius:
+            x = rng.randint(radius, width - radius)
+        pool.spawn(x, y, radius, 4)
+        dicts.append({'x': x, 'y': y, 'radius': radius})
+    return pool, dicts
+
+
+def grid_collides(grid, pool, rect):
+    n = pool.count
+    grid.build(pool.x[:n], pool.y[:n])
+    idx = grid.query(rect.left, rect.top, rect.right, rect.bottom, margin=pool.max_radius)
+    if len(idx) == 0:
+        return False
+    x, y, r = pool.x[idx], pool.y[idx], pool.radius[idx]
+    dx = x - np.clip(x, rect.left, rect.right)
+    dy = y - np.clip(y, rect.top, rect.bottom)
+    return bool((dx * dx + dy * dy < r * r).any())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark broad-phase tabrakan.")
+    parser.add_argument("--counts", nargs="+", type=int, default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    reference = circle_rectangle_collision
+    rect = pygame.Rect(265, 540, 50, 50)
+    grid = UniformGrid(64)
+
+    print(f"{'count':>8}{'reference us':>14}{'numpy us':>11}{'y-band us':>11}{'grid us':>10}")
+    for count in args.counts:
+        pool, dicts = make_field(count, rect.left, rect.right)
+        expected = any(reference(c, rect) for c in dicts)
+        assert pool.collides_rect(rect) == expected == grid_collides(grid, pool, rect)
+        repeat = max(1, args.repeat * 100 // max(count, 100))
+        timings = {
+            "reference": lambda: any(reference(c, rect) for c in dicts),
+            "numpy": lambda: bool(pool.collision_mask(rect.left, rect.top, rect.right, rect.bottom).any()),
+            "band": lambda: pool.collides_rect(rect),
+            "grid": lambda: grid_collides(grid, pool, rect),
+        }
+        us = {name: min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+              for name, fn in timings.items()}
+        print(f"{count:>8}{us['reference']:>14.1f}{us['numpy']:>11.1f}{us['band']:>11.1f}{us['grid']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark VectorEnv: env-steps per detik untuk beberapa jumlah permainan
+sekaligus, dibandingkan dengan loop GameEngine biasa (satu permainan).
+
+Semua permainan memakai aksi acak (diam/kiri/kanan) yang dibuat sebelum
+pengukuran. --verify menjalankan ulang setiap permainan yang selesai dengan
+GameEngine (seed dan input yang sama) dan memastikan skor serta tick game
+over-nya sama persis.
+
+Contoh:
+    python bench_vec_env.py --envs 1 64 1024 4096 --steps 1000
+    python bench_vec_env.py --verify --envs 64 --steps 3000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from engine import GameConfig, GameEngine, SPAWN_RATE_MAP
+from vec_env import VectorEnv
+
+
+def random_actions(steps, num_envs, seed):
+    return np.random.default_rng(seed).integers(0, 3, size=(steps, num_envs), dtype=np.int64)
+
+
+def bench_engine(config, actions):
+    """Loop GameEngine biasa (satu permainan, reset saat game over); mengembalikan steps/detik."""
+    engine = GameEngine(config, 0)
+    seed = 0
+    start = time.perf_counter()
+    for action in actions.tolist():
+        if engine.step(action):
+            seed += 1
+            engine.reset(seed)
+    return len(actions) / (time.perf_counter() - start)
+
+
+def bench_vec(env, actions):
+    """Mengembalikan (env-steps/detik, jumlah permainan selesai)."""
+    env.reset(0)
+    finished = 0
+    start = time.perf_counter()
+    for row in actions:
+        _, _, dones, _ = env.step(row)
+        finished += int(np.count_nonzero(dones))
+    return actions.size / (time.perf_counter() - start), finished
+
+
+def verify(env, actions):
+    """
+    Setiap permainan yang selesai dijalankan ulang dengan GameEngine.
+    Mengembalikan (jumlah permainan dicek, jumlah yang berbeda).
+    """
+    env.reset(0)
+    episode_start = np.zeros(env.num_envs, dtype=np.int64)
+    checked = mismatches = 0
+    for step, row in enumerate(actions):
+        seeds = env.seeds.copy()
+        _, _, dones, info = env.step(row)
+        for i in np.flatnonzero(dones & info["game_over"]).tolist():
+            engine = GameEngine(env.env_config(i), int(seeds[i]))
+            inputs = actions[episode_start[i]:step + 1, i].tolist()
+            over = [engine.step(action) for action in inputs]
+            checked += 1
+            if not over[-1] or any(over[:-1]) or engine.score != info["score"][i]:
+                mismatches += 1
+                print(f"  env {i} seed {seeds[i]}: score {info['score'][i]} after {len(inputs)} steps, "
+                      f"GameEngine {engine.score} (game over at step {over.index(True) + 1 if any(over) else None})")
+        episode_start[dones] = step + 1
+    return checked, mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark VectorEnv (banyak permainan sekaligus).")
+    parser.add_argument("--envs", nargs="+", type=int, default=[1, 16, 256, 1024, 4096])
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--difficulties", nargs="+", choices=list(SPAWN_RATE_MAP), default=list(SPAWN_RATE_MAP))
+    parser.add_argument("--size", default="800x600")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verify", action="store_true", help="bandingkan setiap permainan dengan GameEngine")
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    config = GameConfig(width=width, height=height, scoreboard_width=int(width * 0.2),
+                        player_speed=7, base_speed=6, spawn_rate=SPAWN_RATE_MAP[args.difficulties[0]])
+
+    if args.verify:
+        errors = 0
+        for num_envs in args.envs:
+            env = VectorEnv(num_envs, config, args.difficulties)
+            checked, mismatches = verify(env, random_actions(args.steps, num_envs, args.seed))
+            print(f"{num_envs} envs x {args.steps} steps: {checked} finished games checked, {mismatches} mismatches")
+            errors += mismatches
+        print("OK" if errors == 0 else f"FAILED ({errors})")
+        return 1 if errors else 0
+
+    engine_rate = bench_engine(config, random_actions(args.steps * 10, 1, args.seed)[:, 0])
+    print(f"GameEngine loop: {engine_rate:,.0f} steps/s")
+    print(f"{'envs':>6}{'env-steps/s':>14}{'vs engine':>11}{'games done':>12}")
+    for num_envs in args.envs:
+        env = VectorEnv(num_envs, config, args.difficulties)
+        rate, finished = bench_vec(env, random_actions(args.steps, num_envs, args.seed))
+        print(f"{num_envs:>6}{rate:>14,.0f}{rate / engine_rate:>10.1f}x{finished:>12}")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Benchmark game loop Falling Circles.
+
+Menjalankan loop yang sama dengan PlayingScene di game_core.py untuk mode
+classic (Game_Edukasi.py) dan menu (Game_Edukasi WMenu.py): engine.step +
+load_highscores + draw_frame + flip,
+dengan input terskrip, memakai driver video dummy SDL sehingga bisa
+dijalankan di mesin Linux tanpa layar.
+
+Contoh:
+    python benchmark.py --counts 10 1000 --sizes 800x600 --ticks 200
+    python benchmark.py --save-baseline baseline.json
+    python benchmark.py --compare baseline.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from dirty_render import DirtyRectRenderer
+from engine import GameEngine, NO_INPUT, LEFT, RIGHT
+from game_core import MODES, SPAWN_RATE_MAP, Game
+from profiler import percentile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_COUNTS = [10, 100, 1000, 10000, 100000]
+DEFAULT_SIZES = ["800x600", "1920x1080", "3840x2160"]
+
+
+def load_variant(name):
+    """Game untuk mode classic/menu (tanpa membuka window; setup_case membuat display)."""
+    return Game(MODES[name])
+
+
+def scripted_inputs(ticks):
+    """Input terskrip: tahan kiri 90 tick, diam 30 tick, tahan kanan 90 tick, dst."""
+    pattern = [LEFT] * 90 + [NO_INPUT] * 30 + [RIGHT] * 90 + [NO_INPUT] * 30
+    return [pattern[i % len(pattern)] for i in range(ticks)]
+
+
+def fill_obstacles(engine, count, rng, bottom=None):
+    """
+    Menambah lingkaran sampai jumlahnya count dengan urutan spawn seperti di game
+    (y menurun, kecepatan engine.speed), sehingga ObstaclePool.y_sorted tetap True
+    dan cek tabrakan memakai broad-phase pita-y. Jika bottom diberikan, lingkaran
+    tersebar di ketinggian -r..bottom; selain itu muncul di atas layar (y = -r)
+    seperti spawn_circle().
+    """
+    r = engine.config.circle_radius
+    gameplay_width = engine.gameplay_width
+    missing = count - len(engine.obstacles)
+    if missing <= 0:
+        return
+    if bottom is None:
+        ys = [-r] * missing
+    else:
+        ys = sorted((rng.uniform(-r, bottom) for _ in range(missing)), reverse=True)
+    for y in ys:
+        engine.obstacles.spawn(rng.randint(r, gameplay_width - r), y, r, engine.speed)
+
+
+def setup_case(game, size, spawn_rate, count, seed):
+    width, height = size
+    game.width, game.height = width, height
+    screen = pygame.display.set_mode(size)
+    config = game.make_config()
+    config.spawn_rate = spawn_rate
+    config.invulnerable = True  # tabrakan tetap dihitung, tapi game tidak berhenti
+    engine = GameEngine(config, seed)
+    rng = random.Random(seed)
+    fill_obstacles(engine, count, rng, height)  # sebar di seluruh layar
+    return screen, engine, rng
+
+
+def run_loop(game, screen, engine, rng, count, inputs, render):
+    """Loop setara PlayingScene.tick(); mengembalikan list durasi per tick (detik)."""
+    renderer = DirtyRectRenderer((0, 0, 0))
+    times = []
+    for tick_inputs in inputs:
+        start = time.perf_counter()
+        pygame.event.pump()
+        engine.step(tick_inputs)
+        fill_obstacles(engine, count, rng)
+        if render:
+            highscores = game.load_highscores()
+            game.draw_frame(screen, engine, renderer, highscores)
+            renderer.end()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_case(game, size, spawn_rate, count, ticks, render, seed=1):
+    inputs = scripted_inputs(ticks)
+    screen, engine, rng = setup_case(game, size, spawn_rate, count, seed)
+    times = run_loop(game, screen, engine, rng, count, inputs, render)
+
+    # Peak memory diukur di pass terpisah yang lebih pendek karena tracemalloc memperlambat loop
+    screen, engine, rng = setup_case(game, size, spawn_rate, count, seed)
+    tracemalloc.start()
+    run_loop(game, screen, engine, rng, count, inputs[:min(ticks, 30)], render)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    values = sorted(times)
+    return {
+        "ticks_per_sec": len(times) / sum(times),
+        "p50_ms": percentile(values, 50) * 1000.0,
+        "p95_ms": percentile(values, 95) * 1000.0,
+        "p99_ms": percentile(values, 99) * 1000.0,
+        "peak_kb": peak / 1024.0,
+    }
+
+
+def parse_size(text):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark game loop Falling Circles (headless).")
+    parser.add_argument("--variants", nargs="+", choices=sorted(MODES), default=sorted(MODES))
+    parser.add_argument("--counts", nargs="+", type=int, default=DEFAULT_COUNTS,
+                        help="jumlah lingkaran yang dipertahankan selama benchmark")
+    parser.add_argument("--difficulties", nargs="+", default=None,
+                        help="spawn rate diambil dari SPAWN_RATE_MAP (default: semua)")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="ukuran window, misalnya 800x600")
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--no-render", action="store_true", help="hanya simulasi, tanpa menggambar")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH", help="bandingkan ticks/sec dengan baseline")
+    args = parser.parse_args(argv)
+    if args.save_baseline:
+        args.save_baseline = os.path.abspath(args.save_baseline)
+    if args.compare:
+        args.compare = os.path.abspath(args.compare)
+
+    os.chdir(HERE)
+    games = {name: load_variant(name) for name in args.variants}
+    difficulties = args.difficulties or list(SPAWN_RATE_MAP)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = {}
+    print(f"{'case':<42}{'ticks/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'peak KB':>10}{'vs base':>10}")
+    for variant in args.variants:
+        game = games[variant]
+        for difficulty in difficulties:
+            if game.mode.menu:
+                game.difficulty = difficulty
+            for size_text in args.sizes:
+                for count in args.counts:
+                    case = f"{variant}/{difficulty}/{size_text}/n={count}"
+                    result = run_case(game, parse_size(size_text), SPAWN_RATE_MAP[difficulty],
+                                      count, args.ticks, not args.no_render)
+                    results[case] = result
+                    delta = ""
+                    if case in baseline:
+                        change = result["ticks_per_sec"] / baseline[case]["ticks_per_sec"] - 1.0
+                        delta = f"{change * 100:+.1f}%"
+                    print(f"{case:<42}{result['ticks_per_sec']:>10.1f}{result['p50_ms']:>9.2f}"
+                          f"{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}{result['peak_kb']:>10.0f}{delta:>10}")
+                    sys.stdout.flush()
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import bisect
+import operator
+
+import numpy as np
+
+
+def y_band(y, count, top, bottom):
+    """
+    Broad-phase pita-y untuk array y yang terurut menurun (lingkaran paling
+    bawah di indeks 0, seperti urutan spawn di ObstaclePool).
+    Mengembalikan (start, stop) sehingga hanya y[start:stop] yang berada di
+    antara top dan bottom. Biayanya O(log n) (binary search), bukan O(n).
+    """
+    start = bisect.bisect_left(y, -bottom, 0, count, key=operator.neg)
+    stop = bisect.bisect_right(y, -top, start, count, key=operator.neg)
+    return start, stop
+
+
+class UniformGrid:
+    """
+    Grid seragam untuk broad-phase umum (tidak butuh urutan y).
+    build() mengelompokkan pusat lingkaran per sel, lalu query() hanya
+    mengembalikan indeks lingkaran di sel yang tumpang tindih dengan persegi,
+    dan candidate_pairs() hanya memasangkan lingkaran di sel yang bertetangga
+    (untuk interaksi antar lingkaran tanpa O(n^2)).
+    cell_size sebaiknya >= 2 * radius terbesar.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._order = np.zeros(0, dtype=np.intp)
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._col0 = self._row0 = 0
+        self._cols = 1
+
+    def build(self, x, y):
+        """Bangun ulang grid dari array posisi (misalnya pool.x[:n], pool.y[:n])."""
+        if len(x) == 0:
+            self._order = np.zeros(0, dtype=np.intp)
+            self._keys = np.zeros(0, dtype=np.int64)
+            return
+        cols = np.floor_divide(x, self.cell_size).astype(np.int64)
+        rows = np.floor_divide(y, self.cell_size).astype(np.int64)
+        self._col0 = int(cols.min())
+        self._row0 = int(rows.min())
+        self._cols = int(cols.max()) - self._col0 + 1
+        keys = (rows - self._row0) * self._cols + (cols - self._col0)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def query(self, left, top, right, bottom, margin=0.0):
+        """Indeks kandidat yang pusatnya berada di sel yang menyentuh persegi (+margin, misalnya radius)."""
+        if len(self._keys) == 0:
+            return self._order
+        cs = self.cell_size
+        c0 = max(int((left - margin) // cs) - self._col0, 0)
+        c1 = min(int((right + margin) // cs) - self._col0, self._cols - 1)
+        r0 = max(int((top - margin) // cs) - self._row0, 0)
+        r1 = int((bottom + margin) // cs) - self._row0
+        if c0 > c1 or r0 > r1:
+            return self._order[:0]
+        parts = []
+        for row in range(r0, r1 + 1):
+            base = row * self._cols
+            lo = np.searchsorted(self._keys, base + c0, side="left")
+            hi = np.searchsorted(self._keys, base + c1, side="right")
+            if hi > lo:
+                parts.append(self._order[lo:hi])
+        if not parts:
+            return self._order[:0]
+        return np.concatenate(parts)
+
+    def candidate_pairs(self):
+        """Pasangan indeks (i, j), i != j, yang berada di sel sama atau bertetangga."""
+        if len(self._keys) == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        cells, starts, counts = np.unique(self._keys, return_index=True, return_counts=True)
+        lookup = dict(zip(cells.tolist(), zip(starts.tolist(), counts.tolist())))
+        cols = self._cols
+        firsts, seconds = [], []
+        for key, (start, count) in lookup.items():
+            members = self._order[start:start + count]
+            if count > 1:
+                i, j = np.triu_indices(count, k=1)
+                firsts.append(members[i])
+                seconds.append(members[j])
+            col = key % cols
+            # Tetangga "ke depan" saja agar setiap pasangan sel hanya diperiksa sekali
+            for dr, dc in ((0, 1), (1, -1), (1, 0), (1, 1)):
+                if not 0 <= col + dc < cols:
+                    continue
+                other = lookup.get(key + dr * cols + dc)
+                if other is None:
+                    continue
+                others = self._order[other[0]:other[0] + other[1]]
+                firsts.append(np.repeat(members, len(others)))
+                seconds.append(np.tile(others, len(members)))
+        if not firsts:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        return np.concatenate(firsts), np.concatenate(seconds)
@@ -0,0 +1,107 @@
+import os
+
+import pygame
+
+SCALE_MODES = ("off", "integer", "smooth")
+
+
+class ScaledCanvas:
+    """
+    Kanvas offscreen dengan resolusi logis tetap yang di-scale ke window.
+    Game menggambar ke canvas.surface (ukuran logis, tidak bergantung monitor),
+    lalu present() men-scale hasilnya satu kali ke window dengan letterbox:
+      integer  faktor bulat terbesar yang muat (piksel tajam); hanya area
+               dirty yang di-scale jika daftar rect diberikan. Jika window
+               lebih kecil dari resolusi logis, jatuh ke mode smooth.
+      smooth   smoothscale seluruh frame agar memenuhi window.
+    Aktifkan dengan env GAME_RENDER_SCALE=integer|smooth dan atur ukuran
+    logis dengan GAME_LOGICAL_SIZE=1280x720.
+    """
+
+    def __init__(self, logical_size, mode="integer"):
+        if mode not in SCALE_MODES[1:]:
+            raise ValueError(f"unknown scale mode {mode!r}")
+        self.logical_size = tuple(logical_size)
+        self.mode = mode
+        self.surface = None
+        self.window = None
+        self.viewport = pygame.Rect(0, 0, *self.logical_size)
+        self.factor = 1
+        self._needs_full = True
+
+    @classmethod
+    def from_env(cls, default_size):
+        """ScaledCanvas sesuai env, atau None jika mode skala tidak aktif (menggambar langsung ke window)."""
+        mode = os.environ.get("GAME_RENDER_SCALE", "off").lower()
+        if mode in ("", "off"):
+            return None
+        size = os.environ.get("GAME_LOGICAL_SIZE")
+        if size:
+            default_size = tuple(int(v) for v in size.lower().split("x"))
+        return cls(default_size, mode)
+
+    def attach(self, window):
+        """Pakai surface window ini (panggil lagi setelah set_mode/resize)."""
+        self.window = window
+        if self.surface is None:
+            self.surface = pygame.Surface(self.logical_size).convert(window)
+        lw, lh = self.logical_size
+        ww, wh = window.get_size()
+        self.factor = min(ww // lw, wh // lh) if self.mode == "integer" else 0
+        if self.factor >= 1:
+            size = (lw * self.factor, lh * self.factor)
+        else:
+            scale = min(ww / lw, wh / lh)
+            size = (max(1, int(lw * scale)), max(1, int(lh * scale)))
+        self.viewport = pygame.Rect((0, 0), size)
+        self.viewport.center = (ww // 2, wh // 2)
+        self._needs_full = True
+
+    def to_window(self, rect):
+        """Rect di koordinat logis -> rect di window (hanya untuk mode integer)."""
+        k = self.factor
+        return pygame.Rect(self.viewport.x + rect.x * k, self.viewport.y + rect.y * k, rect.w * k, rect.h * k)
+
+    def to_logical(self, pos):
+        """Posisi di window -> posisi di kanvas logis (kebalikan letterbox dan skala)."""
+        lw, lh = self.logical_size
+        view = self.viewport
+        return ((pos[0] - view.x) * lw // view.w, (pos[1] - view.y) * lh // view.h)
+
+    def map_mouse_event(self, event):
+        """
+        Event mouse dengan pos (dan rel) dalam koordinat logis, misalnya untuk
+        pygame_menu yang digambar di kanvas. Event tanpa pos dikembalikan apa adanya.
+        """
+        if not hasattr(event, "pos"):
+            return event
+        attrs = dict(event.__dict__, pos=self.to_logical(event.pos))
+        if "rel" in attrs:
+            lw, lh = self.logical_size
+            attrs["rel"] = (event.rel[0] * lw // self.viewport.w, event.rel[1] * lh // self.viewport.h)
+        return pygame.event.Event(event.type, attrs)
+
+    def present(self, rects=None):
+        """Scale canvas ke window dan tampilkan. rects = area logis yang berubah (None = seluruh frame)."""
+        window = self.window
+        if self._needs_full:
+            window.fill((0, 0, 0))
+            rects = None
+            self._needs_full = False
+        if self.factor >= 1 and rects is not None:
+            bounds = self.surface.get_rect()
+            updated = []
+            for rect in rects:
+                rect = pygame.Rect(rect).clip(bounds)
+                if rect.w and rect.h:
+                    dest = self.to_window(rect)
+                    pygame.transform.scale(self.surface.subsurface(rect), dest.size, window.subsurface(dest))
+                    updated.append(dest)
+            pygame.display.update(updated)
+            return
+        dest = window.subsurface(self.viewport)
+        if self.factor >= 1:
+            pygame.transform.scale(self.surface, self.viewport.size, dest)
+        else:
+            pygame.transform.smoothscale(self.surface, self.viewport.size, dest)
+        pygame.display.flip()
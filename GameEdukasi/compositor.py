@@ -0,0 +1,54 @@
+import pygame
+
+
+class StaticLayer:
+    """
+    Layer statis (latar area gameplay, garis pemisah, panel highscore) yang
+    di-render sekali ke Surface hasil convert(), lalu dipakai ulang setiap
+    frame. prepare() mengembalikan Surface kosong hanya jika layer harus
+    digambar ulang, yaitu saat ukuran berubah (VIDEORESIZE) atau saat
+    konten (misalnya list highscore) bukan objek yang sama lagi.
+    """
+
+    def __init__(self):
+        self.surface = None
+        self._content = None
+
+    def prepare(self, size, content):
+        """Surface yang harus digambar ulang pemanggil, atau None jika cache masih berlaku."""
+        if self.surface is not None and self.surface.get_size() == size and content is self._content:
+            return None
+        self.surface = pygame.Surface(size).convert()
+        self._content = content
+        return self.surface
+
+    def invalidate(self):
+        self._content = None
+
+
+class CircleSprites:
+    """
+    Sprite lingkaran yang di-render sekali per (radius, warna) dengan colorkey
+    dan RLEACCEL, sehingga setiap lingkaran cukup di-blit (bukan
+    pygame.draw.circle per lingkaran per frame). Hasilnya sama piksel-per-piksel
+    dengan pygame.draw.circle(surface, color, (x, y), radius).
+    """
+
+    def __init__(self):
+        self._sprites = {}
+
+    def get(self, radius, color):
+        key = (radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            colorkey = (255, 0, 255) if tuple(color[:3]) != (255, 0, 255) else (0, 255, 0)
+            sprite = pygame.Surface((radius * 2, radius * 2)).convert()
+            sprite.fill(colorkey)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+            self._sprites[key] = sprite
+        return sprite
+
+    def blit(self, surface, color, x, y, radius):
+        """Gambar lingkaran berpusat di (x, y); mengembalikan Rect yang digambar."""
+        return surface.blit(self.get(radius, color), (x - radius, y - radius))
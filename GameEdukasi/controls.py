@@ -0,0 +1,43 @@
+import pygame
+
+# Event yang dipakai game: keyboard (KEYDOWN membawa unicode dari TEXTINPUT untuk input nama),
+# resize/expose window untuk menggambar ulang, dan fokus hilang untuk melepas tombol
+GAME_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.VIDEORESIZE,
+               pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWFOCUSLOST)
+# Tambahan untuk pygame_menu (menu bisa dipakai dengan mouse)
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL)
+# Event yang membuat isi layar harus digambar ulang meskipun state tidak berubah
+REDRAW_EVENTS = (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
+def allow_only(event_types):
+    """Hanya event_types yang masuk ke antrean event; sisanya dibuang oleh SDL."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(event_types))
+
+
+def needs_redraw(events):
+    return any(event.type in REDRAW_EVENTS for event in events)
+
+
+class KeyState:
+    """
+    Status tombol yang ditahan, dilacak dari KEYDOWN/KEYUP (pengganti
+    pygame.key.get_pressed() setiap frame). Semua tombol dilepas saat window
+    kehilangan fokus, karena KEYUP-nya tidak akan pernah diterima.
+    """
+
+    def __init__(self):
+        self.held = set()
+
+    def process(self, events):
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.held.clear()
+
+    def is_held(self, key):
+        return key in self.held
@@ -0,0 +1,80 @@
+import os
+
+import pygame
+
+
+def update_display(rects=None):
+    """pygame.display.update() untuk seluruh layar (rects None) atau hanya rects."""
+    if rects is None:
+        pygame.display.update()
+    else:
+        pygame.display.update(rects)
+
+
+class DirtyRectRenderer:
+    """
+    Renderer dirty-rectangle.
+    Setiap frame hanya area yang digambar pada frame sebelumnya yang dihapus,
+    dan hanya area lama + area baru yang dikirim ke pygame.display.update().
+    Set full_redraw=True (atau env GAME_FULL_REDRAW=1) untuk kembali ke
+    screen.fill() + display.update() penuh saat debugging.
+    background bisa berupa warna atau Surface (layer statis); jika Surface,
+    area lama dipulihkan dengan blit dari layer tersebut, bukan fill.
+    present(rects) dipanggil oleh end() untuk menampilkan frame, misalnya
+    ScaledCanvas.present jika game digambar ke kanvas offscreen.
+    """
+
+    def __init__(self, background=(0, 0, 0), full_redraw=None, present=update_display):
+        if full_redraw is None:
+            full_redraw = os.environ.get("GAME_FULL_REDRAW", "0") not in ("", "0")
+        self.background = background
+        self.full_redraw = full_redraw
+        self.present = present
+        self._previous = []
+        self._current = []
+        self._needs_full = True
+
+    def set_background(self, background):
+        """Ganti latar (misalnya layer statis yang baru dibangun ulang); frame berikutnya digambar penuh."""
+        self.background = background
+        self._needs_full = True
+
+    def invalidate(self):
+        """Paksa frame berikutnya digambar ulang penuh (misalnya setelah resize)."""
+        self._needs_full = True
+
+    def begin(self, surface):
+        """
+        Mulai frame baru.
+        Mengembalikan True jika layar dibersihkan penuh, artinya lapisan statis
+        (scoreboard, dll) harus digambar ulang oleh pemanggil.
+        """
+        self._current = []
+        background = self.background
+        if self.full_redraw or self._needs_full:
+            if isinstance(background, pygame.Surface):
+                surface.blit(background, (0, 0))
+            else:
+                surface.fill(background)
+            return True
+        if isinstance(background, pygame.Surface):
+            for rect in self._previous:
+                surface.blit(background, rect, rect)
+        else:
+            for rect in self._previous:
+                surface.fill(background, rect)
+        return False
+
+    def add(self, rect):
+        """Catat area yang digambar pada frame ini (rect hasil pygame.draw / blit)."""
+        self._current.append(rect)
+        return rect
+
+    def end(self):
+        """Kirim area yang berubah ke layar."""
+        if self.full_redraw or self._needs_full:
+            self.present(None)
+            self._needs_full = False
+        else:
+            self.present(self._previous + self._current)
+        self._previous = self._current
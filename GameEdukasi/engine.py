@@ -0,0 +1,307 @@
+import math
+import random
+
+from obstacles import ObstaclePool
+
+# Bit input untuk step(): bisa digabung, misalnya LEFT | RIGHT
+NO_INPUT = 0
+LEFT = 1
+RIGHT = 2
+
+# Tick dasar per detik: kecepatan, spawn_rate, stage_threshold dan skor didefinisikan per tick 60 Hz.
+# GameConfig.tick_rate boleh berbeda (misalnya 30 di hardware lemah); satu step lalu mewakili
+# TICK_RATE / tick_rate tick dasar.
+TICK_RATE = 60
+
+# Difficulty mode menu: penambahan kecepatan per stage dan jumlah tick antar spawn
+DIFFICULTY_SPEED_MAP = {'Easy': 1, 'Medium': 2, 'Hard': 3}
+SPAWN_RATE_MAP = {'Easy': 80, 'Medium': 50, 'Hard': 30}
+
+
+class GameConfig:
+    """Parameter simulasi Falling Circles (ukuran layar, kecepatan, spawn, stage)."""
+
+    def __init__(self, width=800, height=600, scoreboard_width=220,
+                 player_width=50, player_height=50, player_speed=5,
+                 circle_radius=20, base_speed=4, speed_increment=1,
+                 spawn_rate=30, stage_threshold=1000, invulnerable=False, tick_rate=TICK_RATE, swept=True):
+        self.width = width
+        self.height = height
+        self.scoreboard_width = scoreboard_width
+        self.player_width = player_width
+        self.player_height = player_height
+        self.player_speed = player_speed
+        self.circle_radius = circle_radius
+        self.base_speed = base_speed            # Kecepatan dasar lingkaran
+        self.speed_increment = speed_increment  # Penambahan kecepatan per stage
+        self.spawn_rate = spawn_rate            # Jumlah tick antar spawn lingkaran
+        self.stage_threshold = stage_threshold  # Skor untuk naik stage
+        self.invulnerable = invulnerable        # Tabrakan dicek tapi tidak mengakhiri game (benchmark)
+        self.tick_rate = tick_rate              # Step simulasi per detik
+        self.swept = swept                      # Tabrakan kontinu; False = aturan diskret lama per tick
+
+
+class FixedTimestep:
+    """
+    Akumulator fixed-step: waktu frame nyata (dt dari clock.tick()) dikumpulkan
+    lalu dipecah menjadi tick simulasi 1/rate detik, sehingga kecepatan game dan
+    skor tidak bergantung pada FPS layar. alpha adalah sisa waktu sebagai
+    pecahan satu tick, untuk interpolasi posisi saat menggambar.
+    max_frame_time membatasi dt agar frame yang sangat lambat tidak memicu
+    terlalu banyak tick sekaligus.
+    """
+
+    def __init__(self, rate=TICK_RATE, max_frame_time=0.25):
+        self.step = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """Tambahkan dt detik; mengembalikan jumlah tick yang harus dijalankan."""
+        self.accumulator += min(dt, self.max_frame_time)
+        ticks = int(self.accumulator // self.step)
+        self.accumulator -= ticks * self.step
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+
+class GameEngine:
+    """
+    Simulasi game tanpa pygame: spawn, gerak, stage/skor, dan tabrakan.
+    Satu panggilan step(inputs) = satu step (1/config.tick_rate detik, yaitu
+    dt tick dasar). RNG memakai seed sendiri sehingga permainan dengan seed
+    dan input yang sama selalu menghasilkan hasil yang sama, dan bisa
+    dijalankan headless secepat mungkin.
+
+    Dengan config.swept, step dihitung sebagai gerak kontinu: lingkaran
+    muncul dan kecepatan berganti tepat pada waktunya (juga di tengah step),
+    dan tabrakan dicek sepanjang lintasan (swept.py), bukan hanya di posisi
+    akhir. Hasilnya sama pada tick_rate berapa pun selama input yang sama
+    ditahan selama waktu yang sama, sehingga simulasi 30 Hz tidak bisa
+    ditembus lingkaran cepat dan tetap sama dengan simulasi 240 Hz.
+    Tanpa swept, aturan diskret lama dipakai (untuk replay lama).
+    """
+
+    def __init__(self, config=None, seed=None):
+        self.config = config or GameConfig()
+        self.rng = random.Random()
+        self.obstacles = ObstaclePool()
+        self.profiler = None  # FrameProfiler opsional untuk mengukur waktu per fase
+        self.recorder = None  # ReplayRecorder opsional yang mencatat input setiap tick
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Mulai permainan baru. Jika seed None, seed acak dipilih (tetap disimpan di self.seed)."""
+        cfg = self.config
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng.seed(seed)
+        if self.recorder is not None:
+            self.recorder.start(cfg, seed)
+        self.width = cfg.width
+        self.height = cfg.height
+        self.scoreboard_width = cfg.scoreboard_width
+        self.dt = TICK_RATE / cfg.tick_rate  # tick dasar per step
+        self.steps = 0
+        self.obstacles.clear()
+        # Pastikan pemain muncul di area gameplay (0 sampai gameplay_width)
+        self.player_x = self.gameplay_width // 2 - cfg.player_width // 2
+        self.prev_player_x = self.player_x
+        self.player_y = self.height - cfg.player_height - 10
+        self.score = 0
+        self.stage = 1
+        self.speed = cfg.base_speed
+        self.spawn_timer = 0
+        self.next_spawn = cfg.spawn_rate - 1  # waktu spawn berikutnya (tick dasar), untuk swept
+        self.game_over = False
+
+    @property
+    def gameplay_width(self):
+        """Lebar area gameplay (tanpa area highscore)."""
+        return self.width - self.scoreboard_width
+
+    def resize(self, width, height):
+        """Ubah ukuran area permainan (misalnya karena VIDEORESIZE)."""
+        if self.recorder is not None:
+            self.recorder.resize(width, height)
+        self.width = width
+        self.height = height
+        # Update posisi pemain agar tetap berada di area gameplay
+        self.player_y = height - self.config.player_height - 10
+
+    def player_rect(self):
+        """Persegi pemain sebagai tuple (x, y, w, h)."""
+        return (self.player_x, self.player_y, self.config.player_width, self.config.player_height)
+
+    def render_player_rect(self, alpha=1.0):
+        """Persegi pemain diinterpolasi antara tick sebelumnya (alpha=0) dan sekarang (alpha=1)."""
+        x = self.prev_player_x + (self.player_x - self.prev_player_x) * alpha
+        return (round(x), self.player_y, self.config.player_width, self.config.player_height)
+
+    _STATE = ("width", "height", "scoreboard_width", "player_x", "prev_player_x", "player_y",
+              "score", "stage", "speed", "spawn_timer", "next_spawn", "steps", "game_over")
+
+    def snapshot(self):
+        """State lengkap engine (termasuk RNG) sehingga restore() bisa melanjutkan dari titik ini."""
+        return ({name: getattr(self, name) for name in self._STATE},
+                self.rng.getstate(), self.obstacles.snapshot())
+
+    def restore(self, state):
+        values, rng_state, obstacles = state
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.rng.setstate(rng_state)
+        self.obstacles.restore(obstacles)
+
+    def spawn_circle(self):
+        """Menambahkan lingkaran baru di atas layar pada posisi x acak di area gameplay."""
+        r = self.config.circle_radius
+        x_pos = self.rng.randint(r, self.gameplay_width - r)
+        self.obstacles.spawn(x_pos, -r, r, self.speed)
+
+    def step(self, inputs=NO_INPUT):
+        """
+        Menjalankan satu step simulasi dengan input LEFT/RIGHT (ditahan selama step).
+        Mengembalikan True jika game over (step berikutnya tidak mengubah apa pun).
+        """
+        if self.game_over:
+            return True
+        if self.recorder is not None:
+            self.recorder.record(inputs)
+        self.steps += 1
+        if self.config.swept:
+            return self._step_swept(inputs)
+        return self._step_discrete(inputs)
+
+    def _update_stage(self, ticks):
+        """Stage dan kecepatan setelah bertahan ticks tick dasar (skor = tick yang dilewati)."""
+        cfg = self.config
+        new_stage = int(ticks) // cfg.stage_threshold + 1
+        if new_stage != self.stage:
+            self.stage = new_stage
+            self.speed = cfg.base_speed + (self.stage - 1) * cfg.speed_increment
+            self.obstacles.set_velocity(self.speed)
+
+    def _step_discrete(self, inputs):
+        """Aturan asli: spawn, gerak sejauh satu step, lalu cek tabrakan di posisi akhir saja."""
+        cfg = self.config
+        prof = self.profiler
+        dt = self.dt
+
+        self.spawn_timer += dt
+        if self.spawn_timer >= cfg.spawn_rate:
+            self.spawn_circle()
+            self.spawn_timer = 0
+        if prof is not None:
+            prof.lap("spawn")
+
+        # Gerakkan pemain (pastikan pemain tidak keluar dari area gameplay)
+        self.prev_player_x = self.player_x
+        if inputs & LEFT and self.player_x > 0:
+            self.player_x -= cfg.player_speed * dt
+        if inputs & RIGHT and self.player_x < self.gameplay_width - cfg.player_width:
+            self.player_x += cfg.player_speed * dt
+
+        self.obstacles.advance(dt)
+        if prof is not None:
+            prof.lap("movement")
+        self.obstacles.cull(self.height)
+        if prof is not None:
+            prof.lap("cull")
+
+        left, top = self.player_x, self.player_y
+        hit = self.obstacles.collides(left, top, left + cfg.player_width, top + cfg.player_height)
+        if prof is not None:
+            prof.lap("collision")
+        if hit and not cfg.invulnerable:
+            self.game_over = True
+            return True
+
+        # Update skor dan stage
+        self.score = self.steps * TICK_RATE // cfg.tick_rate
+        self._update_stage(self.score)
+        return False
+
+    def _step_swept(self, inputs):
+        """
+        Step kontinu dari waktu t0 ke t1 (tick dasar). Step dipecah menjadi
+        segmen pada waktu spawn, pergantian stage dan saat pemain menyentuh
+        dinding, sehingga di setiap segmen semua gerak lurus dengan kecepatan
+        tetap dan tabrakan bisa dihitung tepat dengan ObstaclePool.sweep().
+        """
+        cfg = self.config
+        prof = self.profiler
+        pool = self.obstacles
+        t = (self.steps - 1) * TICK_RATE / cfg.tick_rate
+        t1 = self.steps * TICK_RATE / cfg.tick_rate
+        direction = (1 if inputs & RIGHT else 0) - (1 if inputs & LEFT else 0)
+        velocity = direction * cfg.player_speed
+        # Dinding yang dituju (pemain di luar area setelah resize tidak ditarik masuk)
+        if direction > 0:
+            wall = max(self.gameplay_width - cfg.player_width, self.player_x)
+        else:
+            wall = min(0, self.player_x)
+        top, width, height = self.player_y, cfg.player_width, cfg.player_height
+        self.prev_player_x = self.player_x
+        hit_time = None
+
+        while t < t1:
+            # Kejadian tepat di waktu t: naik stage (kecepatan baru), lalu lingkaran baru
+            self._update_stage(t)
+            while self.next_spawn <= t:
+                self.spawn_circle()
+                self.next_spawn += cfg.spawn_rate
+            end = min(t1, self.next_spawn, self.stage * cfg.stage_threshold)
+            if prof is not None:
+                prof.lap("spawn")
+
+            x0 = self.player_x
+            x1 = x0 + velocity * (end - t)
+            wall_time = end
+            if direction and (x1 - wall) * direction > 0:
+                wall_time = t + (wall - x0) / velocity
+                x1 = wall
+            s = pool.sweep(x0, x1, top, width, height, 0.0, wall_time - t)
+            if s is not None:
+                hit_time = t + s * (wall_time - t)
+            elif wall_time < end:
+                # Sisa segmen: pemain diam di dinding, lingkaran terus bergerak
+                s = pool.sweep(x1, x1, top, width, height, wall_time - t, end - t)
+                if s is not None:
+                    hit_time = wall_time + s * (end - wall_time)
+            if prof is not None:
+                prof.lap("collision")
+            if hit_time is not None and not cfg.invulnerable:
+                break
+            hit_time = None
+            pool.advance(end - t)
+            self.player_x = x1
+            t = end
+            if prof is not None:
+                prof.lap("movement")
+
+        if hit_time is not None:
+            # Keadaan saat tabrakan; skor = tick dasar yang dilewati penuh sebelum tabrakan
+            # (sama dengan cek diskret 60 Hz, yang melihat tabrakan di akhir tick berikutnya)
+            pool.advance(hit_time - t)
+            if self.player_x != x1:
+                self.player_x += (x1 - self.player_x) * min((hit_time - t) / (wall_time - t), 1.0)
+            if prof is not None:
+                prof.lap("movement")
+            self.score = math.floor(hit_time)
+            self.game_over = True
+            return True
+
+        pool.cull(self.height)
+        if prof is not None:
+            prof.lap("cull")
+        self.score = int(t1)
+        self._update_stage(t1)
+        return False
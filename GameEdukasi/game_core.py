@@ -0,0 +1,532 @@
+"""
+Inti Falling Circles yang dipakai bersama oleh kedua launcher.
+
+Game_Edukasi.py (window 800x600 yang bisa di-resize, tanpa menu) dan
+Game_Edukasi WMenu.py (fullscreen, menu pygame_menu, highscore per
+difficulty) hanya memilih GameMode lalu memanggil Game(mode).run().
+Window/kanvas, aset, highscore, renderer frame dan semua scene ada di sini,
+sehingga optimasi cukup dikerjakan sekali.
+
+Contoh:
+    from game_core import CLASSIC, Game
+    Game(CLASSIC).run()
+"""
+from assets import AssetManager  # di-import pertama agar waktu startup diukur dari awal
+import os
+import sys
+
+import pygame
+
+from highscore_store import HighscoreStore, BackgroundWriter
+from leaderboard_db import SQLiteHighscoreStore
+from leaderboard_net import NetworkHighscoreStore
+from text_cache import TextCache, ScoreboardPanel
+from dirty_render import DirtyRectRenderer, update_display
+from canvas import ScaledCanvas
+from compositor import StaticLayer, CircleSprites
+from engine import (GameConfig, GameEngine, FixedTimestep, NO_INPUT, LEFT, RIGHT, TICK_RATE,
+                    DIFFICULTY_SPEED_MAP, SPAWN_RATE_MAP)
+from profiler import FrameProfiler, GCMonitor
+from replay import ReplayRecorder, prune_replays
+from scenes import Scene, SceneManager
+from controls import GAME_EVENTS, MOUSE_EVENTS, allow_only, needs_redraw
+
+# Warna-warna
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED   = (255, 0, 0)
+BLUE  = (0, 0, 255)
+
+# Frame rate layar (GAME_FPS=144 atau 30); simulasi tetap berjalan 60 tick per detik
+FPS = int(os.environ.get("GAME_FPS", "60"))
+# Step simulasi per detik (GAME_TICK_RATE=30 untuk hardware lemah). Tabrakan kontinu membuat
+# hasilnya sama dengan simulasi 60 atau 240 Hz; hanya posisi antar step yang diinterpolasi.
+SIM_RATE = int(os.environ.get("GAME_TICK_RATE", TICK_RATE))
+
+# Setiap permainan direkam (seed + input per tick) ke folder ini untuk verifikasi skor
+# dengan "python replay.py verify <file>". GAME_REPLAY_DIR= (kosong) mematikan rekaman.
+# File ditulis di thread latar belakang; hanya GAME_REPLAY_KEEP rekaman terbaru yang disimpan.
+REPLAY_DIR = os.environ.get("GAME_REPLAY_DIR", "replays")
+REPLAY_KEEP = int(os.environ.get("GAME_REPLAY_KEEP", "200"))
+
+
+class GameMode:
+    """
+    Perbedaan antar launcher: tampilan window, menu, parameter permainan dan
+    file highscore. difficulty None berarti tanpa pilihan difficulty (satu
+    file highscore, kecepatan dan spawn tetap dari GameMode).
+    scoreboard_width bisa angka tetap atau pecahan lebar layar (< 1).
+    scoreboard_gap adalah jarak dari judul "High Scores" ke entry pertama.
+    """
+
+    def __init__(self, name, fullscreen=False, menu=False, window_size=(800, 600), logical_size=(800, 600),
+                 caption="Falling Circles", scoreboard_width=220, scoreboard_gap=30, player_speed=5, base_speed=4,
+                 speed_increment=1, spawn_rate=30, stage_threshold=1000, difficulty=None,
+                 highscore_pattern="highscores.txt"):
+        self.name = name
+        self.fullscreen = fullscreen
+        self.menu = menu
+        self.window_size = window_size      # diabaikan jika fullscreen (pakai ukuran monitor)
+        self.logical_size = logical_size    # ukuran kanvas default untuk GAME_RENDER_SCALE
+        self.caption = caption
+        self.scoreboard_width = scoreboard_width
+        self.scoreboard_gap = scoreboard_gap
+        self.player_speed = player_speed
+        self.base_speed = base_speed
+        self.speed_increment = speed_increment
+        self.spawn_rate = spawn_rate
+        self.stage_threshold = stage_threshold
+        self.difficulty = difficulty
+        self.highscore_pattern = highscore_pattern
+
+
+CLASSIC = GameMode("classic", caption="Falling Circles - Dodge the Obstacles")
+MENU = GameMode("menu", fullscreen=True, menu=True, logical_size=(1280, 720), caption="Falling Circles - Menu",
+                scoreboard_width=0.2, scoreboard_gap=20, player_speed=7, base_speed=6, difficulty='Medium',
+                highscore_pattern="highscores_{}.txt")
+MODES = {mode.name: mode for mode in (CLASSIC, MENU)}
+
+
+class Game:
+    """
+    Satu sesi permainan: window (atau kanvas), aset, font, profiler, cache
+    teks/sprite dan penyimpanan highscore dibuat sekali dan dipakai ulang
+    oleh semua scene di setiap ronde. width/height adalah ukuran permukaan
+    gambar (ukuran logis jika kanvas aktif).
+    """
+
+    def __init__(self, mode):
+        pygame.init()
+        try:
+            pygame.mixer.init()
+        except Exception as e:
+            print("Error initializing mixer:", e)
+        self.mode = mode
+        self.difficulty = mode.difficulty
+        self.window = None
+        self.canvas = None
+        self.screen = None
+        self.width, self.height = mode.window_size
+
+        # Asset audio baru dimuat saat pertama kali dipakai lalu di-cache.
+        # Background music di-stream dari file oleh mixer.music (tidak di-decode seluruhnya),
+        # sedangkan game over sound di-decode di thread latar belakang.
+        self.assets = AssetManager()
+        self.assets.register("music", self._load_music)
+        self.assets.register("game_over", lambda: pygame.mixer.Sound("game_over.wav"))
+
+        # Font default pygame dimuat langsung (SysFont(None) menghasilkan font yang sama,
+        # tetapi lebih dulu memindai semua font sistem)
+        self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 22)
+
+        # Profiler waktu per fase (GAME_PROFILE=1 atau tekan F3 saat bermain),
+        # termasuk jumlah GC per menit
+        self.profiler = FrameProfiler()
+        self.gc_monitor = GCMonitor().start()
+        self.profiler.add_counter("gc", self.gc_monitor.stats)
+
+        # Cache surface teks, layer statis (latar, scoreboard, garis pemisah) dan sprite lingkaran
+        self.text_cache = TextCache()
+        self.scoreboard_panel = ScoreboardPanel(self.text_cache, self.font, WHITE,
+                                                first_gap=mode.scoreboard_gap)
+        self.static_layer = StaticLayer()
+        self.circle_sprites = CircleSprites()
+
+        # Highscore dibaca sekali lalu disajikan dari memori dan ditulis secara atomik
+        # di thread latar belakang. GAME_LEADERBOARD_DB=<path> memakai leaderboard SQLite
+        # (file teks lama dimigrasikan otomatis saat pertama kali dibaca).
+        if os.environ.get("GAME_LEADERBOARD_DB"):
+            self.highscore_store = SQLiteHighscoreStore(os.environ["GAME_LEADERBOARD_DB"],
+                                                        legacy_pattern=mode.highscore_pattern)
+        else:
+            self.highscore_store = HighscoreStore(mode.highscore_pattern, watch_mtime=True, background=True)
+        # GAME_LEADERBOARD_SERVER=host:port menampilkan leaderboard bersama semua kabinet;
+        # store lokal di atas tetap dipakai sebagai cadangan saat server tidak terjangkau
+        if os.environ.get("GAME_LEADERBOARD_SERVER"):
+            self.highscore_store = NetworkHighscoreStore(os.environ["GAME_LEADERBOARD_SERVER"],
+                                                         fallback=self.highscore_store)
+
+    @staticmethod
+    def _load_music():
+        pygame.mixer.music.load("BGM.mp3")  # Ubah ke "background.ogg" jika perlu
+        return "BGM.mp3"
+
+    # --- Window ---
+    def open_window(self):
+        """
+        Buat window sesuai mode. GAME_RENDER_SCALE=integer|smooth menggambar di
+        kanvas berukuran logis tetap (GAME_LOGICAL_SIZE) lalu di-scale ke window.
+        """
+        if self.mode.fullscreen:
+            info = pygame.display.Info()
+            self.window = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(self.mode.window_size, pygame.RESIZABLE)
+        pygame.display.set_caption(self.mode.caption)
+        # Hanya event yang dipakai game (dan menu) yang masuk antrean
+        allow_only(GAME_EVENTS + MOUSE_EVENTS if self.mode.menu else GAME_EVENTS)
+        self.canvas = ScaledCanvas.from_env(self.mode.logical_size)
+        if self.canvas is not None:
+            self.canvas.attach(self.window)
+            self.screen = self.canvas.surface
+        else:
+            self.screen = self.window
+        self.width, self.height = self.screen.get_size()
+        self.assets.mark("window")
+
+    def resize_window(self, size):
+        """
+        Ukuran window berubah (VIDEORESIZE). Mengembalikan True jika ukuran
+        area permainan ikut berubah (tanpa kanvas).
+        """
+        self.window = pygame.display.set_mode(size, pygame.RESIZABLE)
+        if self.canvas is not None:
+            # Area permainan tetap; hanya skala kanvas ke window yang berubah
+            self.canvas.attach(self.window)
+            return False
+        self.screen = self.window
+        self.width, self.height = size
+        return True
+
+    def present(self, rects=None):
+        """Tampilkan frame (seluruh layar atau hanya rects), lewat kanvas jika mode skala aktif."""
+        if self.canvas is not None:
+            self.canvas.present(rects)
+        else:
+            update_display(rects)
+
+    def draw_text(self, text, color, x, y, font=None):
+        """Menggambar teks pada layar (surface teks diambil dari cache)."""
+        self.screen.blit(self.text_cache.render(font or self.font, text, color), (x, y))
+
+    # --- Konfigurasi dan highscore ---
+    @property
+    def scoreboard_width(self):
+        width = self.mode.scoreboard_width
+        return int(self.width * width) if width < 1 else width
+
+    def make_config(self):
+        """Konfigurasi engine sesuai mode, difficulty dan ukuran layar saat ini."""
+        mode = self.mode
+        speed_increment, spawn_rate = mode.speed_increment, mode.spawn_rate
+        if self.difficulty is not None:
+            speed_increment = DIFFICULTY_SPEED_MAP[self.difficulty]
+            spawn_rate = SPAWN_RATE_MAP[self.difficulty]
+        return GameConfig(width=self.width, height=self.height, scoreboard_width=self.scoreboard_width,
+                          player_width=50, player_height=50, player_speed=mode.player_speed,
+                          circle_radius=20, base_speed=mode.base_speed, speed_increment=speed_increment,
+                          spawn_rate=spawn_rate, stage_threshold=mode.stage_threshold, tick_rate=SIM_RATE)
+
+    def load_highscores(self):
+        """Highscore difficulty saat ini dari cache (file hanya dibaca ulang jika berubah)."""
+        return self.highscore_store.load(self.difficulty)
+
+    def update_highscores(self, name, score):
+        """Entry dengan nama yang sama hanya di-overwrite jika skor baru lebih tinggi."""
+        return self.highscore_store.update(name, score, self.difficulty)
+
+    def highscore_title(self):
+        if self.difficulty is None:
+            return "High Scores:"
+        return f"High Scores ({self.difficulty}):"
+
+    def replay_label(self):
+        if self.difficulty is None:
+            return self.mode.name
+        return f"{self.mode.name}:{self.difficulty}"
+
+    # --- Frame permainan ---
+    def draw_frame(self, surface, engine, renderer, highscores, alpha=1.0):
+        """
+        Menggambar satu frame permainan dari state engine.
+        alpha (0..1) menginterpolasi posisi antara tick sebelumnya dan tick terakhir.
+        """
+        gameplay_width = engine.gameplay_width
+        # Layer statis hanya digambar ulang saat ukuran layar atau daftar highscore berubah
+        layer = self.static_layer.prepare(surface.get_size(), highscores)
+        if layer is not None:
+            layer.fill(BLACK)
+            self.scoreboard_panel.draw(layer, self.highscore_title(), highscores, gameplay_width + 10, 10)
+            pygame.draw.line(layer, WHITE, (gameplay_width, 0), (gameplay_width, engine.height), 2)
+        # Layer dibagi oleh beberapa renderer (scene, benchmark), jadi renderer yang belum
+        # memakai layer ini juga harus diberi, bukan hanya saat layer dibangun ulang
+        if renderer.background is not self.static_layer.surface:
+            renderer.set_background(self.static_layer.surface)
+        # Pulihkan area frame sebelumnya dari layer statis (atau seluruh layar jika full redraw)
+        renderer.begin(surface)
+
+        # Pemain dan lingkaran hanya di area gameplay (tidak menimpa garis pemisah)
+        surface.set_clip((0, 0, gameplay_width, engine.height))
+        renderer.add(pygame.draw.rect(surface, BLUE, engine.render_player_rect(alpha)))
+        for cx, cy, r in engine.obstacles.interpolated(alpha, engine.dt):
+            renderer.add(self.circle_sprites.blit(surface, RED, int(cx), int(cy), int(r)))
+        renderer.add(self.text_cache.blit_number(surface, self.font, "Score: ", engine.score, WHITE, 10, 10))
+        renderer.add(self.text_cache.blit_number(surface, self.font, "Stage: ", engine.stage, WHITE, 10, 40))
+        surface.set_clip(None)
+
+        # Overlay profiler (hanya jika aktif)
+        for rect in self.profiler.draw_overlay(surface, self.small_font, WHITE, 10, 80):
+            renderer.add(rect)
+
+    # --- Loop utama ---
+    def run(self):
+        """Buka window lalu jalankan semua scene dalam satu loop (tanpa rekursi saat restart)."""
+        self.open_window()
+        manager = SceneManager(pygame.time.Clock(), FPS, on_first_frame=lambda: self.assets.mark("first_frame"))
+        if self.mode.menu:
+            manager.add("menu", MenuScene(self))
+        manager.add("playing", PlayingScene(self))
+        manager.add("name_entry", NameEntryScene(self))
+        manager.add("game_over", GameOverScene(self))
+        manager.run("menu" if self.mode.menu else "playing")
+        # Pastikan highscore yang tertunda sudah tertulis sebelum keluar
+        self.highscore_store.flush()
+        pygame.quit()
+        sys.exit()
+
+
+def read_inputs(keys):
+    """Membaca status tombol (KeyState dari SceneManager) menjadi input engine (LEFT/RIGHT)."""
+    inputs = NO_INPUT
+    if keys.is_held(pygame.K_LEFT):
+        inputs |= LEFT
+    if keys.is_held(pygame.K_RIGHT):
+        inputs |= RIGHT
+    return inputs
+
+
+# --- Scene Menu ---
+class MenuScene(Scene):
+    """
+    Menu pygame_menu (pilih difficulty, mulai, keluar) yang dibuat sekali.
+    Menu tidak beranimasi, jadi scene ini idle dan hanya digambar ulang jika
+    update() melaporkan perubahan.
+    """
+
+    idle = True
+
+    def __init__(self, game):
+        import pygame_menu
+
+        self.game = game
+        # Ukuran dan posisi mengikuti permukaan gambar (kanvas jika skala aktif), bukan display
+        self.menu = pygame_menu.Menu('Falling Circles', game.width, game.height,
+                                     theme=pygame_menu.themes.THEME_DARK,
+                                     screen_dimension=(game.width, game.height))
+        difficulties = list(DIFFICULTY_SPEED_MAP)
+        self.menu.add.selector('Difficulty :', [(name, name) for name in difficulties],
+                               default=difficulties.index(game.difficulty), onchange=self.set_difficulty)
+        self.menu.add.button('Start', lambda: self.manager.switch("playing"))
+        self.menu.add.button('Exit', lambda: self.manager.stop())
+
+    def set_difficulty(self, selected, value):
+        self.game.difficulty = value
+
+    def enter(self):
+        pygame.display.set_caption(self.game.mode.caption)
+        self.dirty = True
+        # Decode game over sound selagi pemain memilih difficulty
+        self.game.assets.preload(["game_over"])
+
+    def tick(self, events):
+        if self.game.canvas is not None:
+            # Menu digambar di kanvas logis; posisi mouse dari window harus dipetakan balik
+            events = [self.game.canvas.map_mouse_event(event) for event in events]
+        changed = self.menu.update(events)
+        if self.manager.running and (changed or self.dirty or needs_redraw(events)):
+            self.dirty = False
+            self.menu.draw(self.game.screen)
+            self.game.present()
+
+
+# --- Scene Permainan ---
+class PlayingScene(Scene):
+    """
+    Scene permainan. Engine dan renderer dibuat sekali lalu di-reset setiap
+    ronde, sehingga restart tidak mengalokasikan ulang state permainan.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.engine = GameEngine(game.make_config())
+        self.engine.profiler = game.profiler
+        game.profiler.add_counter("pool", self.engine.obstacles.stats)
+        if REPLAY_DIR:
+            self.engine.recorder = ReplayRecorder()
+            self.replay_writer = BackgroundWriter(lambda path: prune_replays(REPLAY_DIR, REPLAY_KEEP),
+                                                  name="replay-writer")
+        # Hanya area yang berubah yang digambar ulang (GAME_FULL_REDRAW=1 untuk menggambar penuh)
+        self.renderer = DirtyRectRenderer(BLACK, present=game.present)
+        self.timestep = FixedTimestep(SIM_RATE)
+
+    def enter(self):
+        game = self.game
+        # Ukuran window dan difficulty bisa berubah sejak ronde sebelumnya
+        self.engine.config = game.make_config()
+        if self.engine.recorder is not None:
+            self.engine.recorder.label = game.replay_label()
+        self.engine.reset()
+        self.timestep.reset()
+        self.renderer.invalidate()
+
+        # Mulai (kembali) background music; file musik hanya dibuka sekali
+        if game.assets.get("music") is not None and not pygame.mixer.music.get_busy():
+            try:
+                pygame.mixer.music.play(-1)  # Loop tanpa henti
+            except Exception as e:
+                print("Error restarting background music:", e)
+        # Decode game over sound selagi pemain bermain
+        game.assets.preload(["game_over"])
+
+    def begin_frame(self):
+        self.game.profiler.begin_frame()
+
+    def tick(self, events):
+        game = self.game
+        engine = self.engine
+        renderer = self.renderer
+        profiler = game.profiler
+
+        # Saat window di-drag beberapa VIDEORESIZE bisa datang dalam satu frame,
+        # jadi hanya ukuran terakhir yang dipakai
+        resized = None
+        quit_to_menu = False
+        for event in events:
+            if event.type == pygame.VIDEORESIZE and not game.mode.fullscreen:
+                resized = (event.w, event.h)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                    renderer.invalidate()
+                elif event.key == pygame.K_q and game.mode.menu:
+                    quit_to_menu = True
+        if resized is not None:
+            if game.resize_window(resized):
+                engine.resize(game.width, game.height)
+            renderer.invalidate()
+        inputs = read_inputs(self.manager.keys)
+        profiler.lap("events")
+
+        # Tick simulasi sebanyak waktu yang berlalu (spawn, gerak, tabrakan, skor dan stage),
+        # sehingga kecepatan dan skor sama pada FPS berapa pun
+        for _ in range(self.timestep.advance(self.manager.dt)):
+            if engine.step(inputs):
+                if engine.recorder is not None:
+                    engine.recorder.save(REPLAY_DIR, engine.score, self.replay_writer)
+                self.manager.switch("name_entry", score=engine.score)
+                return
+
+        # Scoreboard (layer statis) hanya digambar ulang jika daftar highscore berubah
+        highscores = game.load_highscores()
+        profiler.lap("highscores")
+
+        game.draw_frame(game.screen, engine, renderer, highscores, self.timestep.alpha)
+        profiler.lap("draw")
+        renderer.end()
+        profiler.lap("flip")
+        profiler.end_frame()
+        if quit_to_menu:
+            self.manager.switch("menu")
+
+
+# --- Scene Input Nama ---
+class NameEntryScene(Scene):
+    """
+    Meminta input nama pemain setelah game over (maksimal 12 karakter).
+    Pemain dapat mengetik dan menekan Enter untuk menyelesaikan input.
+    Layar hanya digambar ulang jika nama berubah (scene idle, menunggu event).
+    """
+
+    idle = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self, score):
+        self.score = score
+        self.name = ""
+        self.dirty = True
+        # Hentikan background music agar sound game over terdengar jelas
+        try:
+            pygame.mixer.music.stop()
+            game_over_sound = self.game.assets.get("game_over")
+            if game_over_sound is not None:
+                game_over_sound.play()
+        except Exception as e:
+            print(f"Error playing game over sound: {e}")
+
+    def tick(self, events):
+        game = self.game
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    # Perbarui highscore lalu tampilkan layar game over
+                    highscores = game.update_highscores(self.name.strip() or "Player", self.score)
+                    self.manager.switch("game_over", score=self.score, highscores=highscores)
+                    return
+                elif event.key == pygame.K_BACKSPACE:
+                    self.name = self.name[:-1]
+                    self.dirty = True
+                elif event.unicode and event.unicode.isprintable() and len(self.name) < 12:
+                    self.name += event.unicode
+                    self.dirty = True
+        if not (self.dirty or needs_redraw(events)):
+            return
+        self.dirty = False
+        game.screen.fill(BLACK)
+        game.draw_text("GAME OVER", RED, 40, game.height // 2 - 80)
+        game.draw_text(f"Your Score: {self.score}", WHITE, 40, game.height // 2 - 40)
+        game.draw_text("Enter your name: " + self.name, WHITE, 40, game.height // 2)
+        game.present()
+
+
+# --- Scene Game Over ---
+class GameOverScene(Scene):
+    """
+    Menampilkan skor dan highscore, lalu menunggu R (restart) atau Q
+    (kembali ke menu, atau keluar jika mode tanpa menu).
+    """
+
+    idle = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self, score, highscores):
+        self.score = score
+        self.highscores = highscores
+        self.dirty = True
+
+    def tick(self, events):
+        game = self.game
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    self.manager.switch("playing")
+                    return
+                elif event.key == pygame.K_q:
+                    if game.mode.menu:
+                        self.manager.switch("menu")
+                    else:
+                        self.manager.stop()
+                    return
+        # Isi layar tetap sama selama menunggu; gambar hanya sekali atau saat window perlu digambar ulang
+        if not (self.dirty or needs_redraw(events)):
+            return
+        self.dirty = False
+
+        screen = game.screen
+        scoreboard_x = game.width - game.scoreboard_width
+        screen.fill(BLACK)
+        # Informasi game over di area gameplay (kiri)
+        game.draw_text("GAME OVER", RED, 20, 20)
+        game.draw_text(f"Your Score: {self.score}", WHITE, 20, 60)
+        if game.difficulty is not None:
+            game.draw_text(f"Difficulty: {game.difficulty}", WHITE, 20, 100)
+        hint = "Press R to Restart, Q to Menu" if game.mode.menu else "Press R to Restart or Q to Quit"
+        game.draw_text(hint, WHITE, 20, game.height - 50)
+        # Area highscore di sisi kanan, dipisah garis dari area gameplay
+        game.scoreboard_panel.draw(screen, "High Scores:", self.highscores, scoreboard_x + 10, 20)
+        pygame.draw.line(screen, WHITE, (scoreboard_x, 0), (scoreboard_x, game.height), 2)
+        game.present()
@@ -0,0 +1,212 @@
+import atexit
+import os
+import tempfile
+import threading
+import time
+
+
+def write_atomic(filename, text):
+    """
+    Menulis file secara atomik: tulis ke file sementara di folder yang sama,
+    fsync, lalu rename. Jika program crash di tengah penulisan, file lama
+    tetap utuh (tidak terpotong). text boleh str atau bytes; folder dibuat
+    jika belum ada.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb" if isinstance(text, bytes) else "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def merge_score(highscores, name, score, limit=10):
+    """
+    Daftar highscore baru (terurut, maksimal limit entry) setelah skor ini dimasukkan.
+    Entry dengan nama yang sama hanya di-overwrite jika skor baru lebih tinggi.
+    """
+    highscores = list(highscores)
+    for i, (n, s) in enumerate(highscores):
+        if n == name:
+            if score > s:
+                highscores[i] = (name, score)
+            break
+    else:
+        highscores.append((name, score))
+    highscores.sort(key=lambda x: x[1], reverse=True)
+    return highscores[:limit]
+
+
+def read_highscores(filename):
+    """
+    Membaca file highscore teks (baris "name,score"); baris yang rusak dilewati.
+    Mengembalikan [] jika file tidak ada. Error baca (misalnya izin) diteruskan
+    ke pemanggil.
+    """
+    highscores = []
+    if os.path.exists(filename):
+        with open(filename, "r") as f:
+            for line in f:
+                parts = line.strip().split(",")
+                if len(parts) == 2:
+                    name, s = parts
+                    try:
+                        highscores.append((name, int(s)))
+                    except ValueError:
+                        continue
+    return highscores
+
+
+class BackgroundWriter:
+    """
+    Thread penulis file (highscore, rekaman replay) di latar belakang.
+    submit() tidak pernah menunggu disk; beberapa penulisan ke file yang sama
+    sebelum thread sempat menulis digabung (hanya isi terakhir yang ditulis).
+    flush() menunggu sampai semua penulisan selesai, dan dipanggil otomatis
+    saat program keluar.
+    """
+
+    def __init__(self, on_written=None, name="highscore-writer"):
+        self.on_written = on_written
+        self.name = name
+        self._pending = {}  # filename -> isi file terbaru
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def submit(self, filename, text):
+        with self._cond:
+            self._pending[filename] = text
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                batch = self._pending
+                self._pending = {}
+                self._busy = True
+            for filename, text in batch.items():
+                try:
+                    write_atomic(filename, text)
+                    if self.on_written is not None:
+                        self.on_written(filename)
+                except Exception as e:
+                    print(f"Error saving {filename}: {e}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Tunggu sampai semua penulisan yang tertunda selesai."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+
+class HighscoreStore:
+    """
+    Penyimpanan highscore di memori.
+    Setiap file highscore (per difficulty) hanya dibaca sekali, lalu disajikan
+    dari cache sampai ada penulisan lewat update()/save(). Jika watch_mtime
+    aktif, mtime file dicek paling sering setiap check_interval detik agar
+    perubahan dari luar game tetap terbaca.
+    Jika background=True, file ditulis secara atomik oleh BackgroundWriter
+    sehingga save() tidak memblokir game loop.
+    """
+
+    def __init__(self, pattern="highscores.txt", limit=10, watch_mtime=False, check_interval=1.0,
+                 background=False):
+        self.pattern = pattern
+        self.limit = limit
+        self.watch_mtime = watch_mtime
+        self.check_interval = check_interval
+        self._cache = {}       # filename -> list (name, score)
+        self._mtimes = {}      # filename -> mtime saat terakhir dibaca/ditulis
+        self._last_check = {}  # filename -> waktu terakhir mtime dicek
+        self.writer = BackgroundWriter(self._written) if background else None
+
+    def filename(self, difficulty=None):
+        """Nama file highscore untuk difficulty tertentu (None jika hanya satu file)."""
+        if difficulty is None:
+            return self.pattern
+        return self.pattern.format(difficulty.lower())
+
+    def _mtime(self, filename):
+        try:
+            return os.stat(filename).st_mtime
+        except OSError:
+            return None
+
+    def _is_stale(self, filename):
+        if not self.watch_mtime:
+            return False
+        now = time.monotonic()
+        if now - self._last_check.get(filename, 0.0) < self.check_interval:
+            return False
+        self._last_check[filename] = now
+        return self._mtime(filename) != self._mtimes.get(filename)
+
+    def _read(self, filename):
+        try:
+            return read_highscores(filename)
+        except Exception as e:
+            print(f"Error loading highscores from {filename}: {e}")
+            return []
+
+    def load(self, difficulty=None):
+        """Mengembalikan daftar highscore dari cache (file hanya dibaca jika perlu)."""
+        filename = self.filename(difficulty)
+        if filename not in self._cache or self._is_stale(filename):
+            self._cache[filename] = self._read(filename)
+            self._mtimes[filename] = self._mtime(filename)
+        return self._cache[filename]
+
+    def save(self, highscores, difficulty=None):
+        """Menyimpan highscore ke file dan memperbarui cache."""
+        filename = self.filename(difficulty)
+        self._cache[filename] = list(highscores)
+        text = "".join(f"{name},{s}\n" for name, s in highscores)
+        if self.writer is not None:
+            self.writer.submit(filename, text)
+            return
+        try:
+            write_atomic(filename, text)
+        except Exception as e:
+            print(f"Error saving highscores to {filename}: {e}")
+        self._written(filename)
+
+    def _written(self, filename):
+        # mtime file hasil tulisan sendiri dicatat agar tidak dianggap perubahan dari luar
+        self._mtimes[filename] = self._mtime(filename)
+
+    def flush(self):
+        """Tunggu semua penulisan di latar belakang selesai (panggil sebelum keluar)."""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def update(self, name, score, difficulty=None):
+        """
+        Memperbarui highscore dengan skor baru.
+        Entry dengan nama yang sama hanya di-overwrite jika skor baru lebih tinggi.
+        """
+        highscores = merge_score(self.load(difficulty), name, score, self.limit)
+        self.save(highscores, difficulty)
+        return highscores
+
+    def invalidate(self, difficulty=None):
+        """Membuang cache agar pembacaan berikutnya membaca ulang file."""
+        self._cache.pop(self.filename(difficulty), None)
@@ -0,0 +1,192 @@
+"""
+Leaderboard berbasis SQLite untuk jumlah pemain yang besar.
+
+Setiap (difficulty, name) hanya punya satu baris dengan skor terbaiknya.
+Primary key (difficulty, name) dan index (difficulty, score) membuat
+insert/update dan top-K berjalan lewat B-tree (O(log n)), bukan scan dan
+sort seluruh file seperti update_highscores() versi teks.
+
+Migrasi dari file teks lama terjadi otomatis saat difficulty pertama kali
+dibaca, atau manual lewat command line:
+    python leaderboard_db.py leaderboard.db --import highscores_hard.txt Hard
+    python leaderboard_db.py leaderboard.db --top 10 --difficulty Hard
+    python leaderboard_db.py leaderboard.db --rank ken --difficulty Hard
+"""
+import argparse
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from highscore_store import merge_score, read_highscores
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    difficulty TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (difficulty, score DESC);
+CREATE TABLE IF NOT EXISTS migrated (
+    difficulty TEXT PRIMARY KEY
+);
+"""
+
+
+class Leaderboard:
+    """Akses langsung ke tabel skor SQLite (thread-safe lewat satu lock)."""
+
+    def __init__(self, path="leaderboard.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def submit(self, name, score, difficulty=""):
+        """Simpan skor; skor lama hanya di-overwrite jika skor baru lebih tinggi."""
+        self.submit_many([(name, score)], difficulty)
+
+    def submit_many(self, entries, difficulty=""):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO scores (difficulty, name, score) VALUES (?, ?, ?) "
+                "ON CONFLICT (difficulty, name) DO UPDATE SET score = excluded.score "
+                "WHERE excluded.score > scores.score",
+                [(difficulty, name, score) for name, score in entries])
+
+    def top(self, k=10, difficulty=""):
+        """K skor tertinggi sebagai list (name, score)."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT name, score FROM scores WHERE difficulty = ? "
+                "ORDER BY score DESC, name LIMIT ?", (difficulty, k)).fetchall()
+
+    def rank(self, name, difficulty=""):
+        """
+        Peringkat pemain (1 = teratas), atau None jika pemain belum punya skor.
+        Jumlah skor yang lebih tinggi dihitung dari index skor saja (tanpa membaca tabel).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score FROM scores WHERE difficulty = ? AND name = ?", (difficulty, name)).fetchone()
+            if row is None:
+                return None
+            (better,) = self._conn.execute(
+                "SELECT COUNT(*) FROM scores WHERE difficulty = ? AND score > ?", (difficulty, row[0])).fetchone()
+        return better + 1
+
+    def count(self, difficulty=""):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scores WHERE difficulty = ?", (difficulty,)).fetchone()[0]
+
+    def import_text_file(self, filename, difficulty=""):
+        """Migrasi satu file highscore teks ke database. Mengembalikan jumlah baris yang dibaca."""
+        # Error baca diteruskan agar difficulty ini tidak ditandai sudah dimigrasi
+        entries = read_highscores(filename)
+        self.submit_many(entries, difficulty)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO migrated (difficulty) VALUES (?)", (difficulty,))
+        return len(entries)
+
+    def is_migrated(self, difficulty=""):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM migrated WHERE difficulty = ?", (difficulty,)).fetchone() is not None
+
+
+class SQLiteHighscoreStore:
+    """
+    Pengganti HighscoreStore dengan antarmuka yang sama (load/save/update/flush),
+    tetapi disimpan di SQLite. Top-10 tetap disajikan dari memori; penulisan ke
+    database dijalankan di satu thread latar belakang agar layar tidak tertahan.
+    legacy_pattern adalah pola nama file teks lama untuk migrasi otomatis.
+    """
+
+    def __init__(self, path="leaderboard.db", legacy_pattern=None, limit=10):
+        self.leaderboard = Leaderboard(path)
+        self.legacy_pattern = legacy_pattern
+        self.limit = limit
+        self._cache = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard-writer")
+
+    def _key(self, difficulty):
+        return difficulty or ""
+
+    def filename(self, difficulty=None):
+        return self.leaderboard.path
+
+    def _migrate(self, difficulty):
+        key = self._key(difficulty)
+        if self.legacy_pattern is None or self.leaderboard.is_migrated(key):
+            return
+        filename = self.legacy_pattern if difficulty is None else self.legacy_pattern.format(difficulty.lower())
+        try:
+            self.leaderboard.import_text_file(filename, key)
+        except Exception as e:
+            print(f"Error migrating highscores from {filename}: {e}")
+
+    def load(self, difficulty=None):
+        key = self._key(difficulty)
+        if key not in self._cache:
+            self._migrate(difficulty)
+            self._cache[key] = self.leaderboard.top(self.limit, key)
+        return self._cache[key]
+
+    def save(self, highscores, difficulty=None):
+        key = self._key(difficulty)
+        self._cache[key] = list(highscores)
+        self._executor.submit(self._write, list(highscores), key)
+
+    def update(self, name, score, difficulty=None):
+        """Sama seperti HighscoreStore.update(), tetapi hanya skor baru yang dikirim ke database."""
+        key = self._key(difficulty)
+        self._cache[key] = merge_score(self.load(difficulty), name, score, self.limit)
+        self._executor.submit(self._write, [(name, score)], key)
+        return self._cache[key]
+
+    def _write(self, entries, key):
+        try:
+            self.leaderboard.submit_many(entries, key)
+        except Exception as e:
+            print(f"Error saving highscores to {self.leaderboard.path}: {e}")
+
+    def rank(self, name, difficulty=None):
+        return self.leaderboard.rank(name, self._key(difficulty))
+
+    def invalidate(self, difficulty=None):
+        self._cache.pop(self._key(difficulty), None)
+
+    def flush(self):
+        """Tunggu semua penulisan ke database selesai."""
+        self._executor.submit(lambda: None).result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Leaderboard SQLite Falling Circles.")
+    parser.add_argument("database")
+    parser.add_argument("--difficulty", default="", help="kosong untuk Game_Edukasi.py tanpa menu")
+    parser.add_argument("--import", dest="imports", nargs=2, action="append", default=[],
+                        metavar=("FILE", "DIFFICULTY"), help="migrasi file highscore teks")
+    parser.add_argument("--top", type=int, default=0)
+    parser.add_argument("--rank", metavar="NAME")
+    args = parser.parse_args(argv)
+
+    board = Leaderboard(args.database)
+    for filename, difficulty in args.imports:
+        print(f"Imported {board.import_text_file(filename, difficulty)} rows from {filename}")
+    if args.top:
+        for i, (name, score) in enumerate(board.top(args.top, args.difficulty), start=1):
+            print(f"{i}. {name} - {score}")
+    if args.rank:
+        print(f"{args.rank}: rank {board.rank(args.rank, args.difficulty)} of {board.count(args.difficulty)}")
+    board.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Leaderboard jaringan untuk banyak kabinet game di satu tempat.
+
+Server asyncio menyimpan skor di leaderboard SQLite (leaderboard_db.py) dan
+melayani banyak kabinet lewat TCP. Protokolnya satu objek JSON per baris:
+    {"id": 1, "op": "top", "difficulty": "Hard", "k": 10}  -> {"id": 1, "top": [[name, score], ...]}
+    {"id": 2, "op": "submit", "entries": [[difficulty, name, score], ...]}  -> {"id": 2, "ok": true}
+    push dari server: {"event": "changed", "difficulty": "Hard"}
+Push "changed" dikirim ke setiap koneksi yang pernah membaca difficulty itu
+saat top-K-nya berubah, sehingga kabinet lain langsung memperbarui cache.
+
+Di sisi game, NetworkHighscoreStore menggantikan HighscoreStore (antarmuka
+load/save/update/flush yang sama) tanpa pernah menunggu jaringan di frame
+loop. Aktifkan dengan GAME_LEADERBOARD_SERVER=host:port.
+
+Contoh:
+    python leaderboard_net.py serve --db leaderboard.db --port 8765
+    python leaderboard_net.py top --server 127.0.0.1:8765 --difficulty Hard
+"""
+import argparse
+import asyncio
+import collections
+import json
+import threading
+
+from highscore_store import merge_score
+from leaderboard_db import Leaderboard
+
+DEFAULT_PORT = 8765
+
+
+def parse_address(address):
+    """"host:port" (atau "host" saja) -> (host, port)."""
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, DEFAULT_PORT
+    return host, int(port)
+
+
+def _encode(message):
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class LeaderboardServer:
+    """
+    Server leaderboard. Top-K setiap difficulty disajikan dari memori;
+    penulisan SQLite dijalankan di thread executor agar event loop tidak
+    tertahan disk. Pesan dari satu koneksi diproses berurutan, jadi "top"
+    setelah "submit" di koneksi yang sama selalu sudah memuat skor itu.
+    """
+
+    def __init__(self, leaderboard, limit=10):
+        self.leaderboard = leaderboard
+        self.limit = limit
+        self.server = None
+        self._top = {}       # difficulty -> list (name, score)
+        self._watchers = {}  # difficulty -> set StreamWriter yang perlu push "changed"
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server
+
+    async def serve_forever(self, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await self.start(host, port)
+        for sock in server.sockets:
+            print(f"Leaderboard server listening on {sock.getsockname()[0]}:{sock.getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+    def top(self, key):
+        if key not in self._top:
+            self._top[key] = self.leaderboard.top(self.limit, key)
+        return self._top[key]
+
+    async def submit(self, entries):
+        """Simpan entry [difficulty, name, score]; mengembalikan difficulty yang top-K-nya berubah."""
+        grouped = {}
+        for key, name, score in entries:
+            grouped.setdefault(str(key), []).append((str(name), int(score)))
+        loop = asyncio.get_running_loop()
+        changed = []
+        for key, rows in grouped.items():
+            await loop.run_in_executor(None, self.leaderboard.submit_many, rows, key)
+            top = await loop.run_in_executor(None, self.leaderboard.top, self.limit, key)
+            if top != self._top.get(key):
+                self._top[key] = top
+                changed.append(key)
+        return changed
+
+    def _notify(self, key):
+        message = _encode({"event": "changed", "difficulty": key})
+        for writer in list(self._watchers.get(key, ())):
+            # Tanpa drain(): kabinet yang lambat tidak boleh menahan kabinet lain
+            if not writer.is_closing():
+                writer.write(message)
+
+    async def _handle(self, reader, writer):
+        watched = set()
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                    op = message.get("op")
+                    reply = {"id": message.get("id")}
+                    changed = ()
+                    if op == "top":
+                        key = str(message.get("difficulty", ""))
+                        self._watchers.setdefault(key, set()).add(writer)
+                        watched.add(key)
+                        reply["top"] = self.top(key)[:int(message.get("k", self.limit))]
+                    elif op == "submit":
+                        changed = await self.submit(message.get("entries", ()))
+                        reply["ok"] = True
+                    else:
+                        reply["error"] = f"unknown op {op!r}"
+                except (ValueError, TypeError, AttributeError) as e:
+                    reply, changed = {"error": f"bad request: {e}"}, ()
+                writer.write(_encode(reply))
+                await writer.drain()
+                for key in changed:
+                    self._notify(key)
+        except ConnectionError:
+            pass
+        finally:
+            for key in watched:
+                self._watchers.get(key, set()).discard(writer)
+            writer.close()
+
+
+class NetworkHighscoreStore:
+    """
+    Highscore dari server leaderboard dengan antarmuka HighscoreStore.
+
+    Semua I/O jaringan berjalan di event loop asyncio pada thread latar
+    belakang dengan satu koneksi persisten yang dipakai ulang untuk semua
+    permintaan (dan tersambung ulang otomatis). Frame loop tidak pernah
+    menunggu:
+      load()   top-K dari cache lokal; jika belum ada, meminta ke server di
+               latar belakang dan sementara menyajikan store lokal (fallback)
+      update() langsung memperbarui cache dan store lokal, lalu skor
+               diantrekan dan dikirim ke server per batch setiap batch_interval
+      push     "changed" dari server memicu pengambilan ulang top-K
+    Selama server tidak terjangkau, cache dikosongkan sehingga load() memakai
+    file lokal; skor yang belum terkirim dikirim setelah tersambung lagi.
+    """
+
+    def __init__(self, address, fallback, limit=10, batch_interval=0.5, timeout=2.0, max_pending=10000):
+        self.host, self.port = parse_address(address)
+        self.fallback = fallback
+        self.limit = limit
+        self.batch_interval = batch_interval
+        self.timeout = timeout
+        self.connected = False
+        self._cache = {}       # difficulty -> list (name, score) dari server
+        self._wanted = set()   # difficulty yang pernah dibaca (diambil ulang saat tersambung lagi)
+        self._fetching = set()
+        self._pending = collections.deque(maxlen=max_pending)  # (difficulty, name, score) belum terkirim
+        self._lock = threading.Lock()
+        self._writer = None
+        self._replies = {}
+        self._next_id = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="leaderboard-client", daemon=True)
+        self._thread.start()
+        self._main = asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+
+    def _key(self, difficulty):
+        return difficulty or ""
+
+    def filename(self, difficulty=None):
+        return f"{self.host}:{self.port}"
+
+    # --- Dipanggil dari thread game (tidak pernah menunggu jaringan) ---
+    def load(self, difficulty=None):
+        key = self._key(difficulty)
+        highscores = self._cache.get(key)
+        if highscores is not None:
+            return highscores
+        if key not in self._wanted:
+            self._wanted.add(key)
+            self._loop.call_soon_threadsafe(self._request_fetch, key)
+        return self.fallback.load(difficulty)
+
+    def update(self, name, score, difficulty=None):
+        key = self._key(difficulty)
+        local = self.fallback.update(name, score, difficulty)
+        with self._lock:
+            self._pending.append((key, name, score))
+        if key in self._cache:
+            self._cache[key] = merge_score(self._cache[key], name, score, self.limit)
+            return self._cache[key]
+        return local
+
+    def save(self, highscores, difficulty=None):
+        # Server menyimpan skor terbaik per nama, jadi daftar dikirim sebagai skor biasa
+        key = self._key(difficulty)
+        self.fallback.save(highscores, difficulty)
+        with self._lock:
+            self._pending.extend((key, name, score) for name, score in highscores)
+        if key in self._cache:
+            self._cache[key] = list(highscores)
+
+    def invalidate(self, difficulty=None):
+        key = self._key(difficulty)
+        self._cache.pop(key, None)
+        self._wanted.discard(key)
+        self.fallback.invalidate(difficulty)
+
+    def flush(self):
+        """Kirim skor yang tertunda (menunggu paling lama timeout detik), lalu flush store lokal."""
+        if self.connected:
+            try:
+                asyncio.run_coroutine_threadsafe(self._send_pending(), self._loop).result(self.timeout)
+            except Exception as e:
+                print(f"Error sending highscores to {self.filename()}: {e}")
+        self.fallback.flush()
+
+    def close(self):
+        self._main.cancel()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # --- Event loop latar belakang ---
+    async def _run(self):
+        delay = self.batch_interval
+        while True:
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10.0)
+                continue
+            delay = self.batch_interval
+            try:
+                await self._session(reader, writer)
+            except (OSError, ConnectionError, asyncio.TimeoutError, ValueError) as e:
+                print(f"Leaderboard server {self.filename()} unreachable, using local highscores: {e}")
+            finally:
+                self._disconnect(writer)
+
+    async def _session(self, reader, writer):
+        self._writer = writer
+        self.connected = True
+        reader_task = asyncio.ensure_future(self._read_replies(reader))
+        for key in list(self._wanted):
+            self._request_fetch(key)
+        try:
+            while not reader_task.done():
+                await self._send_pending()
+                await asyncio.wait([reader_task], timeout=self.batch_interval)
+            reader_task.result()
+        finally:
+            reader_task.cancel()
+
+    def _disconnect(self, writer):
+        self.connected = False
+        self._writer = None
+        writer.close()
+        # Tanpa server, load() kembali memakai store lokal sampai top-K diambil ulang
+        self._cache.clear()
+        self._fetching.clear()
+        for future in self._replies.values():
+            if not future.done():
+                future.set_exception(ConnectionError("connection lost"))
+        self._replies.clear()
+
+    async def _read_replies(self, reader):
+        async for line in reader:
+            message = json.loads(line)
+            if message.get("event") == "changed":
+                self._request_fetch(message.get("difficulty", ""))
+                continue
+            future = self._replies.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        raise ConnectionError("server closed the connection")
+
+    async def _request(self, message):
+        if self._writer is None:
+            raise ConnectionError("not connected")
+        self._next_id += 1
+        message["id"] = self._next_id
+        future = self._loop.create_future()
+        self._replies[self._next_id] = future
+        self._writer.write(_encode(message))
+        reply = await asyncio.wait_for(future, self.timeout)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return reply
+
+    async def _send_pending(self):
+        """Kirim semua skor yang tertunda sebagai satu batch."""
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        if not batch:
+            return
+        try:
+            await self._request({"op": "submit", "entries": batch})
+        except BaseException:
+            with self._lock:
+                self._pending.extendleft(reversed(batch))
+            raise
+
+    def _request_fetch(self, key):
+        if self._writer is not None and key not in self._fetching:
+            self._fetching.add(key)
+            asyncio.ensure_future(self._fetch(key))
+
+    async def _fetch(self, key):
+        try:
+            reply = await self._request({"op": "top", "difficulty": key, "k": self.limit})
+        except (ConnectionError, asyncio.TimeoutError, ValueError):
+            # load() berikutnya mencoba lagi
+            self._wanted.discard(key)
+            return
+        finally:
+            self._fetching.discard(key)
+        highscores = [(name, score) for name, score in reply["top"]]
+        # Skor lokal yang belum terkirim tetap ditampilkan
+        with self._lock:
+            unsent = [(name, score) for k, name, score in self._pending if k == key]
+        for name, score in unsent:
+            highscores = merge_score(highscores, name, score, self.limit)
+        self._cache[key] = highscores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server leaderboard jaringan Falling Circles.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="jalankan server leaderboard")
+    serve.add_argument("--db", default="leaderboard.db")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    top = sub.add_parser("top", help="tampilkan top-K dari server")
+    top.add_argument("--server", default=f"127.0.0.1:{DEFAULT_PORT}")
+    top.add_argument("--difficulty", default="", help="kosong untuk Game_Edukasi.py tanpa menu")
+    top.add_argument("-k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        board = Leaderboard(args.db)
+        try:
+            asyncio.run(LeaderboardServer(board).serve_forever(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            board.close()
+        return 0
+
+    async def show_top():
+        reader, writer = await asyncio.open_connection(*parse_address(args.server))
+        writer.write(_encode({"id": 1, "op": "top", "difficulty": args.difficulty, "k": args.k}))
+        reply = json.loads(await reader.readline())
+        writer.close()
+        return reply["top"]
+
+    for i, (name, score) in enumerate(asyncio.run(show_top()), start=1):
+        print(f"{i}. {name} - {score}")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
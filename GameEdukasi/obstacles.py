@@ -0,0 +1,244 @@
+import numpy as np
+
+from broadphase import y_band
+from swept import time_of_impact, times_of_impact
+
+# Di bawah jumlah kandidat ini sweep() memakai versi skalar (overhead NumPy lebih besar dari hitungannya)
+SCALAR_SWEEP_LIMIT = 16
+
+
+class ObstaclePool:
+    """
+    Penyimpanan lingkaran rintangan dalam bentuk structure-of-arrays NumPy.
+    Posisi, radius, kecepatan dan status hidup disimpan di array yang
+    bersebelahan, sehingga update posisi, penghapusan lingkaran di luar layar,
+    dan cek tabrakan dilakukan sekaligus untuk semua lingkaran (vectorized).
+    Lingkaran yang hidup selalu berada di indeks 0..count-1 dengan urutan spawn.
+
+    Selama semua lingkaran muncul dari atas dengan kecepatan yang sama, array
+    y otomatis terurut menurun (yang paling lama paling bawah). Selama itu
+    berlaku (y_sorted), cek tabrakan memakai broad-phase pita-y sehingga hanya
+    lingkaran yang sejajar dengan pemain yang diperiksa.
+
+    Array dialokasikan sekali dengan kapasitas tetap; slot yang dibebaskan oleh
+    cull() dipakai ulang oleh spawn() berikutnya (slot bebas selalu di
+    count..capacity-1), jadi spawn dan cull tidak mengalokasikan objek baru.
+    Kapasitas hanya digandakan jika benar-benar penuh (dihitung di stats()).
+    """
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.y_sorted = True
+        self.max_radius = 0.0
+        # Counter untuk stats(): spawn total, spawn ke slot bekas, lingkaran dihapus, realokasi
+        self.spawned = 0
+        self.reused = 0
+        self.culled = 0
+        self.grows = 0
+        self.peak = 0
+        self._used = 0  # jumlah slot yang pernah dipakai
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.velocity = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        old = (self.x, self.y, self.radius, self.velocity, self.alive)
+        self._allocate(len(self.x) * 2)
+        self.grows += 1
+        for new_arr, old_arr in zip((self.x, self.y, self.radius, self.velocity, self.alive), old):
+            new_arr[:self.count] = old_arr[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.x)
+
+    def stats(self):
+        """
+        Counter pool: jumlah hidup/kapasitas, spawn yang memakai ulang slot
+        (alokasi yang dihindari dibanding satu dict per spawn), lingkaran yang
+        dihapus, puncak jumlah hidup, dan berapa kali array dialokasikan ulang.
+        """
+        return {"live": f"{self.count}/{self.capacity}", "reused": self.reused, "culled": self.culled,
+                "peak": self.peak, "grows": self.grows}
+
+    def __iter__(self):
+        """Iterasi (x, y, radius) setiap lingkaran yang hidup, misalnya untuk menggambar."""
+        n = self.count
+        return zip(self.x[:n].tolist(), self.y[:n].tolist(), self.radius[:n].tolist())
+
+    def interpolated(self, alpha, ticks=1.0):
+        """
+        Seperti __iter__, tetapi y diinterpolasi antara step sebelumnya (alpha=0)
+        dan sekarang (alpha=1). Posisi sebelumnya adalah y - velocity * ticks
+        karena lingkaran hanya bergerak lurus ke bawah (ticks = panjang satu
+        step dalam tick 60 Hz, lihat GameEngine.dt).
+        """
+        n = self.count
+        if alpha >= 1.0:
+            return iter(self)
+        y = self.y[:n] - self.velocity[:n] * (ticks * (1.0 - alpha))
+        return zip(self.x[:n].tolist(), y.tolist(), self.radius[:n].tolist())
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.count = 0
+        self.y_sorted = True
+        self.max_radius = 0.0
+
+    def spawn(self, x, y, radius, velocity=0.0):
+        """Menambahkan lingkaran baru di akhir array (kapasitas digandakan jika penuh)."""
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        if i > 0 and (y > self.y[i - 1] or velocity != self.velocity[i - 1]):
+            # Urutan y tidak lagi terjamin, broad-phase pita-y dimatikan
+            self.y_sorted = False
+        if radius > self.max_radius:
+            self.max_radius = radius
+        self.x[i] = x
+        self.y[i] = y
+        self.radius[i] = radius
+        self.velocity[i] = velocity
+        self.alive[i] = True
+        self.count += 1
+        self.spawned += 1
+        if i < self._used:
+            self.reused += 1
+        else:
+            self._used = i + 1
+        if self.count > self.peak:
+            self.peak = self.count
+
+    def snapshot(self):
+        """Salinan state pool (untuk seek pada replay); kembalikan dengan restore()."""
+        n = self.count
+        arrays = tuple(arr[:n].copy() for arr in (self.x, self.y, self.radius, self.velocity))
+        return arrays, self.y_sorted, self.max_radius
+
+    def restore(self, state):
+        arrays, self.y_sorted, self.max_radius = state
+        n = len(arrays[0])
+        while n > len(self.x):
+            self._grow()
+        for arr, saved in zip((self.x, self.y, self.radius, self.velocity), arrays):
+            arr[:n] = saved
+        self.alive[:n] = True
+        self.alive[n:max(n, self.count)] = False
+        self.count = n
+
+    def set_velocity(self, velocity):
+        """Mengubah kecepatan semua lingkaran (misalnya saat naik stage)."""
+        self.velocity[:self.count] = velocity
+
+    def advance(self, ticks=1.0):
+        """Menggerakkan semua lingkaran ke bawah sesuai kecepatannya (velocity per tick) selama ticks tick."""
+        n = self.count
+        if ticks == 1.0:
+            self.y[:n] += self.velocity[:n]
+        else:
+            self.y[:n] += self.velocity[:n] * ticks
+
+    def cull(self, height):
+        """
+        Menghapus lingkaran yang sudah keluar dari bawah layar, di dalam array yang sama.
+        Jika y terurut, yang keluar selalu lingkaran paling awal (prefix), sehingga
+        sisanya cukup digeser ke depan dan urutan tetap terjaga. Selain itu dipakai
+        swap-remove: slot kosong diisi lingkaran dari ujung array (urutan berubah).
+        """
+        n = self.count
+        alive = self.alive[:n]
+        np.less(self.y[:n] - self.radius[:n], height, out=alive)
+        kept = int(np.count_nonzero(alive))
+        if kept == n:
+            return
+        removed = n - kept
+        arrays = (self.x, self.y, self.radius, self.velocity)
+        if kept == 0:
+            pass
+        elif not alive[:removed].any():
+            for arr in arrays:
+                arr[:kept] = arr[removed:n]
+        else:
+            holes = np.flatnonzero(~alive[:kept])
+            fillers = np.flatnonzero(alive[kept:]) + kept
+            for arr in arrays:
+                arr[holes] = arr[fillers]
+            self.y_sorted = False
+        self.alive[:kept] = True
+        self.alive[kept:n] = False
+        self.count = kept
+        self.culled += removed
+
+    def collision_mask(self, left, top, right, bottom, start=0, stop=None):
+        """
+        Cek tabrakan lingkaran start..stop terhadap persegi sekaligus.
+        Sama dengan circle_rectangle_collision(): cari titik terdekat pada
+        persegi terhadap pusat lingkaran, lalu bandingkan jaraknya dengan radius.
+        """
+        if stop is None:
+            stop = self.count
+        x = self.x[start:stop]
+        y = self.y[start:stop]
+        dx = x - np.clip(x, left, right)
+        dy = y - np.clip(y, top, bottom)
+        r = self.radius[start:stop]
+        return dx * dx + dy * dy < r * r
+
+    def collides(self, left, top, right, bottom):
+        """True jika ada lingkaran yang menabrak persegi."""
+        n = self.count
+        if n == 0:
+            return False
+        start, stop = 0, n
+        if self.y_sorted:
+            # Broad-phase: hanya lingkaran yang pusatnya dalam jarak radius dari pita y persegi
+            start, stop = y_band(self.y, n, top - self.max_radius, bottom + self.max_radius)
+            if start == stop:
+                return False
+        return bool(self.collision_mask(left, top, right, bottom, start, stop).any())
+
+    def sweep(self, left0, left1, top, width, height, ticks0, ticks1):
+        """
+        Tabrakan kontinu: lingkaran bergerak dari y + velocity*ticks0 ke
+        y + velocity*ticks1 sementara persegi (width x height, atas di top)
+        bergeser dari left0 ke left1 dalam waktu yang sama. Mengembalikan
+        pecahan s (0..1) saat tabrakan pertama, atau None jika tidak menabrak.
+        """
+        n = self.count
+        if n == 0:
+            return None
+        start, stop = 0, n
+        if self.y_sorted:
+            # Semua kecepatan sama: pita-y diperlebar sejauh gerak lingkaran selama interval ini
+            v = self.velocity[0]
+            reach_top, reach_bottom = sorted((v * ticks0, v * ticks1))
+            start, stop = y_band(self.y, n, top - self.max_radius - reach_bottom,
+                                 top + height + self.max_radius - reach_top)
+            if start == stop:
+                return None
+        dx = left0 - left1
+        dt = ticks1 - ticks0
+        if stop - start <= SCALAR_SWEEP_LIMIT:
+            s = min(time_of_impact(x - left0, y + v * ticks0 - top, r, dx, v * dt, 0.0, 0.0, width, height)
+                    for x, y, r, v in zip(self.x[start:stop].tolist(), self.y[start:stop].tolist(),
+                                          self.radius[start:stop].tolist(), self.velocity[start:stop].tolist()))
+            return s if s <= 1.0 else None
+        velocity = self.velocity[start:stop]
+        # Koordinat relatif terhadap persegi di awal interval (persegi dianggap diam)
+        toi = times_of_impact(self.x[start:stop] - left0, self.y[start:stop] + velocity * ticks0 - top,
+                              self.radius[start:stop], dx, velocity * dt,
+                              0.0, 0.0, width, height)
+        s = toi.min()
+        return float(s) if s <= 1.0 else None
+
+    def collides_rect(self, rect):
+        """True jika ada lingkaran yang menabrak pygame.Rect (atau objek dengan left/top/right/bottom)."""
+        return self.collides(rect.left, rect.top, rect.right, rect.bottom)
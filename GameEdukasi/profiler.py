@@ -0,0 +1,181 @@
+import atexit
+import csv
+import gc
+import json
+import os
+import time
+from collections import deque
+
+# Urutan fase dalam satu frame main_game()
+PHASES = ("events", "spawn", "movement", "cull", "collision", "highscores", "draw", "flip")
+
+
+def percentile(sorted_values, q):
+    """Percentile sederhana (nearest-rank) dari list yang sudah terurut."""
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(q / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+
+class GCMonitor:
+    """
+    Menghitung garbage collection Python lewat gc.callbacks: jumlah koleksi
+    per generasi, rata-rata per menit sejak start(), dan total waktu jeda GC.
+    """
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause = 0.0
+        self.started = None
+        self._gc_start = 0.0
+
+    def start(self):
+        if self.started is None:
+            self.started = time.perf_counter()
+            gc.callbacks.append(self._callback)
+        return self
+
+    def stop(self):
+        if self.started is not None:
+            gc.callbacks.remove(self._callback)
+            self.started = None
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self.collections[info["generation"]] += 1
+            self.pause += time.perf_counter() - self._gc_start
+
+    def per_minute(self):
+        """Jumlah koleksi (semua generasi) per menit sejak start()."""
+        if self.started is None:
+            return 0.0
+        minutes = (time.perf_counter() - self.started) / 60.0
+        return sum(self.collections) / minutes if minutes > 0 else 0.0
+
+    def stats(self):
+        return {"per_min": round(self.per_minute(), 1), "gen": "/".join(map(str, self.collections)),
+                "pause_ms": round(self.pause * 1000.0, 1)}
+
+
+class FrameProfiler:
+    """
+    Instrumentasi waktu per fase game loop.
+    Pemakaian per frame: begin_frame(), lalu lap("nama_fase") setelah setiap
+    fase selesai, lalu end_frame(). Jika tidak aktif semua method langsung
+    return sehingga biayanya hampir nol.
+
+    Aktifkan dengan env GAME_PROFILE=1 atau tombol toggle (F3) di game.
+    Jika GAME_PROFILE_OUT diisi (.csv atau .json), trace per frame ditulis
+    ke file tersebut saat program selesai.
+
+    add_counter(name, fn) menambahkan counter (fn mengembalikan dict) yang
+    ikut ditampilkan di overlay dan disimpan di ringkasan JSON.
+    """
+
+    def __init__(self, enabled=None, window=600, out_path=None):
+        if enabled is None:
+            enabled = os.environ.get("GAME_PROFILE", "0") not in ("", "0")
+        if out_path is None:
+            out_path = os.environ.get("GAME_PROFILE_OUT") or None
+        self.enabled = enabled
+        self.out_path = out_path
+        self.history = {phase: deque(maxlen=window) for phase in PHASES + ("frame",)}
+        self.trace = []
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._current = {}
+        self._overlay_lines = []
+        self._frames_since_overlay = 0
+        self.counters = {}
+        if out_path:
+            atexit.register(self.dump)
+
+    def add_counter(self, name, fn):
+        self.counters[name] = fn
+
+    def counter_values(self):
+        return {name: fn() for name, fn in self.counters.items()}
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._overlay_lines = []
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        self._current = {}
+
+    def lap(self, phase):
+        """Catat waktu sejak lap sebelumnya sebagai durasi fase ini."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        current = self._current
+        current["frame"] = time.perf_counter() - self._frame_start
+        for phase, samples in self.history.items():
+            samples.append(current.get(phase, 0.0))
+        if self.out_path:
+            self.trace.append([current.get(phase, 0.0) for phase in PHASES + ("frame",)])
+
+    def summary(self):
+        """Dict fase -> (p50, p95, p99) dalam milidetik dari jendela terakhir."""
+        result = {}
+        for phase, samples in self.history.items():
+            values = sorted(samples)
+            result[phase] = tuple(percentile(values, q) * 1000.0 for q in (50, 95, 99))
+        return result
+
+    def draw_overlay(self, surface, font, color, x, y, refresh_every=30):
+        """
+        Menggambar tabel p50/p95/p99 per fase di layar.
+        Teks hanya dihitung ulang setiap refresh_every frame. Mengembalikan
+        list Rect yang digambar (untuk dirty-rect renderer).
+        """
+        if not self.enabled:
+            return []
+        self._frames_since_overlay += 1
+        if not self._overlay_lines or self._frames_since_overlay >= refresh_every:
+            self._frames_since_overlay = 0
+            lines = ["phase       p50    p95    p99 ms"]
+            for phase, (p50, p95, p99) in self.summary().items():
+                lines.append(f"{phase:<10}{p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            for name, values in self.counter_values().items():
+                lines.append(f"{name}: " + " ".join(f"{k}={v}" for k, v in values.items()))
+            self._overlay_lines = [font.render(line, True, color) for line in lines]
+        rects = []
+        for line in self._overlay_lines:
+            rects.append(surface.blit(line, (x, y)))
+            y += line.get_height()
+        return rects
+
+    def dump(self, path=None):
+        """Tulis trace per frame ke CSV atau JSON (ditentukan dari ekstensi file)."""
+        path = path or self.out_path
+        if not path or not self.trace:
+            return
+        columns = PHASES + ("frame",)
+        try:
+            if path.endswith(".json"):
+                summary = {phase: dict(zip(("p50", "p95", "p99"), values))
+                           for phase, values in self.summary().items()}
+                with open(path, "w") as f:
+                    json.dump({"unit": "seconds", "columns": columns, "frames": self.trace,
+                               "summary_ms": summary, "counters": self.counter_values()}, f)
+            else:
+                with open(path, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(("frame_index",) + columns)
+                    for i, row in enumerate(self.trace):
+                        writer.writerow([i] + row)
+        except Exception as e:
+            print(f"Error writing profile trace to {path}: {e}")
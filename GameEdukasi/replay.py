@@ -0,0 +1,316 @@
+"""
+Rekaman dan replay permainan Falling Circles.
+
+Karena GameEngine deterministik, satu permainan cukup disimpan sebagai seed,
+GameConfig, dan input LEFT/RIGHT setiap tick. Input disimpan dengan
+run-length encoding (input yang sama berturut-turut = satu record), sehingga
+permainan 10 menit biasanya hanya beberapa KB.
+
+Format file (little-endian):
+    header  "FCRP", versi (u16), seed (u64), tick (u32), skor (u32),
+            13 field GameConfig (i32), panjang label (u8) + label UTF-8
+            (versi 1: 11 field, tanpa tick_rate dan swept = 60 Hz diskret)
+    body    record: kode (u8) lalu varint
+            kode 0..3  = input (NO_INPUT/LEFT/RIGHT/keduanya), varint = jumlah tick
+            kode 0x10  = resize window, varint lebar lalu varint tinggi
+
+Contoh:
+    python replay.py verify replays/20260101-120000_1234.fcr
+    python replay.py play replays/20260101-120000_1234.fcr
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+
+from engine import GameConfig, GameEngine, TICK_RATE
+from highscore_store import write_atomic
+
+MAGIC = b"FCRP"
+VERSION = 2
+HEADER = struct.Struct("<4sHQII13i")
+CONFIG_FIELDS = ("width", "height", "scoreboard_width", "player_width", "player_height", "player_speed",
+                 "circle_radius", "base_speed", "speed_increment", "spawn_rate", "stage_threshold",
+                 "tick_rate", "swept")
+# Rekaman versi 1 dibuat sebelum tick_rate/swept ada: 60 Hz dengan tabrakan diskret
+HEADER_V1 = struct.Struct("<4sHQII11i")
+V1_DEFAULTS = {"tick_rate": TICK_RATE, "swept": 0}
+OP_RESIZE = 0x10
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """
+    Dipasang ke GameEngine.recorder; engine memanggil start() saat reset,
+    record() setiap tick dan resize() saat ukuran window berubah.
+    save() menulis rekaman ke file (biasanya saat game over).
+    """
+
+    def __init__(self, label=""):
+        self.label = label
+        self.start(GameConfig(), 0)
+
+    def start(self, config, seed):
+        self.config = config
+        self.seed = seed
+        self.ticks = 0
+        self._body = bytearray()
+        self._input = None
+        self._run = 0
+
+    def _flush_run(self):
+        if self._run:
+            self._body.append(self._input)
+            _write_varint(self._body, self._run)
+            self._run = 0
+
+    def record(self, inputs):
+        if inputs != self._input:
+            self._flush_run()
+            self._input = inputs
+        self._run += 1
+        self.ticks += 1
+
+    def resize(self, width, height):
+        self._flush_run()
+        self._input = None
+        self._body.append(OP_RESIZE)
+        _write_varint(self._body, width)
+        _write_varint(self._body, height)
+
+    def to_bytes(self, score):
+        self._flush_run()
+        self._input = None
+        label = self.label.encode("utf-8")[:255]
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, score,
+                             *(int(getattr(self.config, name)) for name in CONFIG_FIELDS))
+        return header + bytes([len(label)]) + label + bytes(self._body)
+
+    def save(self, directory, score, writer=None):
+        """
+        Tulis rekaman ke directory/<waktu>_<skor>.fcr; mengembalikan path file (None jika gagal).
+        Dengan writer (BackgroundWriter) file ditulis di thread latar belakang dan save() tidak menunggu disk.
+        """
+        path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S") + f"_{score}.fcr")
+        data = self.to_bytes(score)
+        if writer is not None:
+            writer.submit(path, data)
+            return path
+        try:
+            write_atomic(path, data)
+        except Exception as e:
+            print(f"Error saving replay to {path}: {e}")
+            return None
+        return path
+
+
+def prune_replays(directory, keep):
+    """Hapus rekaman tertua sehingga paling banyak keep file .fcr tersisa (nama file diawali waktu)."""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".fcr"))
+    except OSError:
+        return 0
+    removed = 0
+    for name in names[:max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+            removed += 1
+        except OSError as e:
+            print(f"Error removing old replay {name}: {e}")
+    return removed
+
+
+class Replay:
+    """
+    Rekaman yang sudah dibaca: seed, config, label, skor yang diklaim, input
+    per tick (bytes, satu byte per tick) dan resize per tick {tick: (w, h)}.
+    """
+
+    def __init__(self, data):
+        magic, version = struct.unpack_from("<4sH", data)
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ValueError("not a Falling Circles replay (or unsupported version)")
+        header = HEADER if version == VERSION else HEADER_V1
+        _, _, seed, ticks, score, *config = header.unpack_from(data)
+        pos = header.size
+        label_len = data[pos]
+        self.label = data[pos + 1:pos + 1 + label_len].decode("utf-8")
+        pos += 1 + label_len
+        self.seed = seed
+        self.ticks = ticks
+        self.score = score
+        self.config_values = dict(V1_DEFAULTS, **dict(zip(CONFIG_FIELDS, config)))
+        self.tick_rate = self.config_values["tick_rate"]
+        inputs = bytearray()
+        self.resizes = {}
+        while pos < len(data):
+            op = data[pos]
+            pos += 1
+            if op == OP_RESIZE:
+                width, pos = _read_varint(data, pos)
+                height, pos = _read_varint(data, pos)
+                self.resizes[len(inputs)] = (width, height)
+            else:
+                run, pos = _read_varint(data, pos)
+                inputs += bytes([op]) * run
+        self.inputs = bytes(inputs)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def new_engine(self):
+        return GameEngine(GameConfig(**self.config_values), self.seed)
+
+    def step(self, engine, tick):
+        """Jalankan tick ke-tick (termasuk resize yang terjadi sebelum tick itu)."""
+        size = self.resizes.get(tick)
+        if size is not None:
+            engine.resize(*size)
+        return engine.step(self.inputs[tick])
+
+    def verify(self):
+        """
+        Simulasi ulang headless secepat mungkin.
+        Mengembalikan (skor hasil simulasi, jumlah tick sampai game over).
+        """
+        engine = self.new_engine()
+        for tick in range(len(self.inputs)):
+            if self.step(engine, tick):
+                return engine.score, tick + 1
+        return engine.score, len(self.inputs)
+
+
+class ReplayPlayer:
+    """
+    Pemutar replay dengan seek. Setiap snapshot_every tick state engine
+    disimpan, sehingga seek() cukup restore snapshot terdekat lalu
+    mensimulasikan paling banyak snapshot_every tick.
+    """
+
+    def __init__(self, replay, snapshot_every=None):
+        self.replay = replay
+        self.snapshot_every = snapshot_every or replay.tick_rate * 5
+        self.engine = replay.new_engine()
+        self.tick = 0
+        self.snapshots = {0: self.engine.snapshot()}
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay.inputs) or self.engine.game_over
+
+    def advance(self, ticks=1):
+        for _ in range(ticks):
+            if self.finished:
+                return
+            self.replay.step(self.engine, self.tick)
+            self.tick += 1
+            if self.tick % self.snapshot_every == 0 and self.tick not in self.snapshots:
+                self.snapshots[self.tick] = self.engine.snapshot()
+
+    def seek(self, tick):
+        tick = max(0, min(tick, len(self.replay.inputs)))
+        base = max(t for t in self.snapshots if t <= tick)
+        if not base <= self.tick <= tick:
+            self.engine.restore(self.snapshots[base])
+            self.tick = base
+        self.advance(tick - self.tick)
+
+
+def play(replay, fps=60):
+    """
+    Putar replay di window. SPACE pause, LEFT/RIGHT seek 5 detik,
+    UP/DOWN kecepatan x2 / /2, ESC keluar.
+    """
+    import pygame
+
+    player = ReplayPlayer(replay)
+    engine = player.engine
+    pygame.init()
+    screen = pygame.display.set_mode((engine.width, engine.height), pygame.RESIZABLE)
+    pygame.display.set_caption(f"Falling Circles - Replay {replay.label}")
+    font = pygame.font.Font(None, 28)
+    clock = pygame.time.Clock()
+    speed, paused, carry = 1.0, False, 0.0
+    running = True
+    while running:
+        dt = clock.tick(fps) / 1000.0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key == pygame.K_UP:
+                    speed = min(speed * 2, 64.0)
+                elif event.key == pygame.K_DOWN:
+                    speed = max(speed / 2, 0.25)
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    offset = replay.tick_rate * 5 * (1 if event.key == pygame.K_RIGHT else -1)
+                    player.seek(player.tick + offset)
+        if not paused:
+            carry += dt * replay.tick_rate * speed
+            player.advance(int(carry))
+            carry -= int(carry)
+        if screen.get_size() != (engine.width, engine.height):
+            screen = pygame.display.set_mode((engine.width, engine.height), pygame.RESIZABLE)
+
+        screen.fill((0, 0, 0))
+        pygame.draw.rect(screen, (0, 0, 255), engine.player_rect())
+        for cx, cy, r in engine.obstacles:
+            pygame.draw.circle(screen, (255, 0, 0), (int(cx), int(cy)), int(r))
+        pygame.draw.line(screen, (255, 255, 255), (engine.gameplay_width, 0),
+                         (engine.gameplay_width, engine.height), 2)
+        status = (f"Score: {engine.score}  Stage: {engine.stage}  "
+                  f"t={player.tick / replay.tick_rate:.1f}s/{len(replay.inputs) / replay.tick_rate:.1f}s  x{speed:g}"
+                  + ("  [paused]" if paused else "") + ("  [end]" if player.finished else ""))
+        screen.blit(font.render(status, True, (255, 255, 255)), (10, 10))
+        pygame.display.flip()
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifikasi atau putar replay Falling Circles.")
+    parser.add_argument("command", choices=("verify", "play"))
+    parser.add_argument("replays", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "play":
+        play(Replay.load(args.replays[0]))
+        return 0
+    failed = 0
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        score, ticks = replay.verify()
+        elapsed = time.perf_counter() - start
+        ok = score == replay.score and ticks == replay.ticks
+        failed += not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {path}: {replay.label} seed={replay.seed} claimed={replay.score} "
+              f"simulated={score} ticks={ticks}/{replay.ticks} ({ticks / max(elapsed, 1e-9):,.0f} ticks/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import pygame
+
+from controls import KeyState
+
+
+class Scene:
+    """
+    Satu layar game (menu, bermain, input nama, game over).
+    SceneManager memanggil enter() saat scene menjadi aktif, begin_frame()
+    sebelum event diambil, lalu tick(events) sekali per frame.
+    Scene dengan idle = True (layar yang hanya menunggu tombol) tidak
+    dijalankan per frame: manager menunggu di pygame.event.wait() dan tick()
+    hanya dipanggil saat ada event (plus sekali setelah enter()).
+    """
+
+    manager = None
+    idle = False
+
+    def enter(self, **params):
+        pass
+
+    def begin_frame(self):
+        pass
+
+    def tick(self, events):
+        pass
+
+
+class SceneManager:
+    """
+    Menjalankan semua scene dalam satu loop iteratif.
+    Pindah scene lewat switch() tidak menambah stack frame (tidak ada
+    pemanggilan rekursif main_game()/main()), sehingga surface display,
+    menu, dan asset dipakai ulang di setiap ronde.
+    on_first_frame dipanggil sekali setelah frame pertama selesai
+    (untuk mengukur waktu startup). dt adalah durasi frame terakhir dalam
+    detik (dari clock.tick()), untuk scene yang memakai FixedTimestep.
+    keys melacak tombol yang ditahan dari semua event yang diterima.
+    """
+
+    def __init__(self, clock, fps, on_first_frame=None):
+        self.clock = clock
+        self.fps = fps
+        self.on_first_frame = on_first_frame
+        self.dt = 0.0
+        self.keys = KeyState()
+        self.scenes = {}
+        self.current = None
+        self.running = False
+        self._pending = None
+
+    def add(self, name, scene):
+        scene.manager = self
+        self.scenes[name] = scene
+        return scene
+
+    def switch(self, name, **params):
+        """Pindah ke scene lain mulai frame berikutnya."""
+        self._pending = (name, params)
+
+    def stop(self):
+        self.running = False
+
+    def run(self, name, **params):
+        """Loop utama; kembali saat stop() dipanggil atau window ditutup."""
+        self.switch(name, **params)
+        self.running = True
+        first_tick = True
+        while self.running:
+            if self._pending is not None:
+                name, params = self._pending
+                self._pending = None
+                self.current = self.scenes[name]
+                self.current.enter(**params)
+                # Waktu menunggu di scene sebelumnya tidak dihitung sebagai dt frame berikutnya
+                self.clock.tick()
+                first_tick = True
+                continue
+            scene = self.current
+            if scene.idle and not first_tick:
+                # Tidur sampai ada event (CPU hampir nol selama layar diam)
+                events = [pygame.event.wait()]
+                events += pygame.event.get()
+                self.dt = self.clock.tick() / 1000.0
+                scene.begin_frame()
+            else:
+                self.dt = self.clock.tick(self.fps) / 1000.0
+                scene.begin_frame()
+                events = pygame.event.get()
+            first_tick = False
+            if any(event.type == pygame.QUIT for event in events):
+                self.running = False
+                break
+            self.keys.process(events)
+            scene.tick(events)
+            if self.on_first_frame is not None:
+                self.on_first_frame()
+                self.on_first_frame = None
@@ -0,0 +1,202 @@
+"""
+Simulasi massal headless untuk menyeimbangkan difficulty.
+
+Menjalankan banyak permainan GameEngine (tanpa pygame) dengan bot untuk
+setiap kombinasi parameter, dibagi ke semua core lewat process pool, lalu
+meringkas distribusi waktu bertahan dan skor per konfigurasi.
+
+Default grid sama dengan difficulty Easy/Medium/Hard mode menu (game_core.MENU)
+(base_speed 6, speed_increment 1/2/3, spawn_rate 80/50/30, player_speed 7).
+
+Bot:
+  idle    tidak bergerak
+  random  menahan kiri/kanan/diam secara acak selama 15-60 tick
+  dodge   heuristik: pilih kiri/diam/kanan dengan jarak horizontal terbesar
+          ke lingkaran yang akan segera mencapai pemain
+
+Contoh:
+    python simulate.py --games 1000 --policies dodge random
+    python simulate.py --spawn-rate 30 40 50 --speed-increment 1 2 --stage-threshold 500 1000 --out grid.csv
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine import GameConfig, GameEngine, NO_INPUT, LEFT, RIGHT, TICK_RATE
+from profiler import percentile
+
+GRID_PARAMS = ("base_speed", "speed_increment", "spawn_rate", "stage_threshold", "player_speed")
+
+
+def idle_policy(rng):
+    return lambda engine: NO_INPUT
+
+
+def random_policy(rng):
+    state = {"input": NO_INPUT, "left": 0}
+
+    def policy(engine):
+        if state["left"] <= 0:
+            state["input"] = rng.choice((NO_INPUT, LEFT, RIGHT))
+            state["left"] = rng.randint(15, 60)
+        state["left"] -= 1
+        return state["input"]
+    return policy
+
+
+def dodge_policy(rng, lookahead=15):
+    """
+    Untuk setiap pilihan gerak, perkirakan posisi pemain dan lingkaran
+    lookahead tick ke depan, lalu pilih yang jarak horizontal terdekatnya
+    ke lingkaran di pita-y pemain paling besar (diam jika seri).
+    """
+    def policy(engine):
+        cfg = engine.config
+        pool = engine.obstacles
+        n = pool.count
+        if n == 0:
+            return NO_INPUT
+        top = engine.player_y
+        bottom = top + cfg.player_height
+        x = pool.x[:n]
+        r = pool.radius[:n]
+        y_future = pool.y[:n] + pool.velocity[:n] * (lookahead * engine.dt)
+        near = (y_future + r >= top) & (pool.y[:n] - r <= bottom)
+        if not near.any():
+            return NO_INPUT
+        x, r = x[near], r[near]
+        best, best_gap = NO_INPUT, None
+        for choice, direction in ((NO_INPUT, 0), (LEFT, -1), (RIGHT, 1)):
+            left = engine.player_x + direction * cfg.player_speed * engine.dt * lookahead
+            left = min(max(left, 0), engine.gameplay_width - cfg.player_width)
+            gap = float((np.abs(x - np.clip(x, left, left + cfg.player_width)) - r).min())
+            if best_gap is None or gap > best_gap:
+                best, best_gap = choice, gap
+        return best
+    return policy
+
+
+POLICIES = {"idle": idle_policy, "random": random_policy, "dodge": dodge_policy}
+
+
+def play_game(config, policy_name, seed, max_ticks):
+    """Satu permainan headless; mengembalikan (skor, jumlah tick bertahan)."""
+    engine = GameEngine(config, seed)
+    policy = POLICIES[policy_name](random.Random(seed ^ 0x5EED))
+    for tick in range(max_ticks):
+        if engine.step(policy(engine)):
+            return engine.score, tick + 1
+    return engine.score, max_ticks
+
+
+def run_batch(config_values, policy_name, seeds, max_ticks):
+    """Dijalankan di proses worker: beberapa permainan dengan konfigurasi yang sama."""
+    config = GameConfig(**config_values)
+    return [play_game(config, policy_name, seed, max_ticks) for seed in seeds]
+
+
+def summarize(config_values, policy_name, results, max_ticks):
+    scores = sorted(score for score, _ in results)
+    seconds = sorted(ticks / TICK_RATE for _, ticks in results)
+    stages = [score // config_values["stage_threshold"] + 1 for score in scores]
+    row = {name: config_values[name] for name in GRID_PARAMS}
+    row.update({
+        "policy": policy_name,
+        "games": len(results),
+        "survival_mean_s": sum(seconds) / len(seconds),
+        "survival_p10_s": percentile(seconds, 10),
+        "survival_p50_s": percentile(seconds, 50),
+        "survival_p90_s": percentile(seconds, 90),
+        "score_mean": sum(scores) / len(scores),
+        "score_p50": percentile(scores, 50),
+        "score_p90": percentile(scores, 90),
+        "score_max": scores[-1],
+        "stage_mean": sum(stages) / len(stages),
+        "timeout_pct": 100.0 * sum(ticks >= max_ticks for _, ticks in results) / len(results),
+    })
+    return row
+
+
+def write_report(rows, path):
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulasi massal Falling Circles untuk balancing difficulty.")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=["dodge"])
+    parser.add_argument("--games", type=int, default=100, help="jumlah permainan per konfigurasi dan bot")
+    parser.add_argument("--base-speed", nargs="+", type=int, default=[6])
+    parser.add_argument("--speed-increment", nargs="+", type=int, default=[1, 2, 3])
+    parser.add_argument("--spawn-rate", nargs="+", type=int, default=[80, 50, 30])
+    parser.add_argument("--stage-threshold", nargs="+", type=int, default=[1000])
+    parser.add_argument("--player-speed", nargs="+", type=int, default=[7])
+    parser.add_argument("--size", default="1920x1080", help="ukuran layar; area gameplay = 80%% lebar")
+    parser.add_argument("--max-minutes", type=float, default=5.0, help="batas lama satu permainan")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=25, help="permainan per tugas worker")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", metavar="PATH", help="tulis laporan ke .csv atau .json")
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    max_ticks = int(args.max_minutes * 60 * TICK_RATE)
+    grid = [dict(zip(GRID_PARAMS, values)) for values in itertools.product(
+        args.base_speed, args.speed_increment, args.spawn_rate, args.stage_threshold, args.player_speed)]
+    seeds = [args.seed + i for i in range(args.games)]
+    chunks = [seeds[i:i + args.chunk] for i in range(0, len(seeds), args.chunk)]
+
+    jobs = []
+    for params, policy_name in itertools.product(grid, args.policies):
+        config_values = dict(params, width=width, height=height, scoreboard_width=int(width * 0.2))
+        for chunk in chunks:
+            jobs.append((config_values, policy_name, chunk, max_ticks))
+
+    start = time.perf_counter()
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            outputs = list(executor.map(run_batch, *zip(*jobs)))
+    else:
+        outputs = [run_batch(*job) for job in jobs]
+    elapsed = time.perf_counter() - start
+
+    grouped = {}
+    for (config_values, policy_name, _, _), results in zip(jobs, outputs):
+        key = (tuple(sorted(config_values.items())), policy_name)
+        grouped.setdefault(key, (config_values, policy_name, []))[2].extend(results)
+    rows = [summarize(config_values, policy_name, results, max_ticks)
+            for config_values, policy_name, results in grouped.values()]
+
+    header = "".join(f"{name:>10}" for name in ("base", "incr", "spawn", "stage@", "pspeed"))
+    print(f"{header}{'policy':>8}{'games':>7}{'surv p10':>10}{'p50':>8}{'p90':>8}"
+          f"{'score mean':>12}{'p90':>8}{'max':>8}{'stage':>7}{'timeout':>9}")
+    for row in rows:
+        params = "".join(f"{row[name]:>10}" for name in GRID_PARAMS)
+        print(f"{params}{row['policy']:>8}{row['games']:>7}{row['survival_p10_s']:>9.1f}s"
+              f"{row['survival_p50_s']:>7.1f}s{row['survival_p90_s']:>7.1f}s{row['score_mean']:>12.0f}"
+              f"{row['score_p90']:>8}{row['score_max']:>8}{row['stage_mean']:>7.2f}{row['timeout_pct']:>8.1f}%")
+    total_ticks = sum(ticks for results in outputs for _, ticks in results)
+    print(f"{sum(len(r) for r in outputs)} games, {total_ticks:,} ticks in {elapsed:.1f}s "
+          f"({total_ticks / elapsed:,.0f} ticks/s, {args.workers} workers)")
+    if args.out:
+        write_report(rows, args.out)
+        print(f"Report saved to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
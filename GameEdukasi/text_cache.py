@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    Cache LRU untuk surface teks hasil font.render().
+    Teks yang sama (font, isi, warna) cukup di-render sekali lalu di-blit ulang.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Mengembalikan surface teks dari cache, render hanya jika belum ada."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def blit_number(self, surface, font, prefix, value, color, x, y):
+        """
+        Menggambar prefix + angka, misalnya "Score: 123".
+        Angka disusun dari glyph per digit yang sudah di-cache sehingga skor
+        yang berubah setiap frame tidak perlu di-render ulang seluruhnya.
+        Mengembalikan Rect area yang digambar.
+        """
+        prefix_obj = self.render(font, prefix, color)
+        rect = surface.blit(prefix_obj, (x, y))
+        x += prefix_obj.get_width()
+        for digit in str(value):
+            glyph = self.render(font, digit, color)
+            rect.union_ip(surface.blit(glyph, (x, y)))
+            x += glyph.get_width()
+        return rect
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+class ScoreboardPanel:
+    """
+    Panel highscore yang di-render sekali ke Surface offscreen.
+    Panel hanya dibuat ulang jika judul, daftar highscore, atau ukurannya berubah.
+    """
+
+    def __init__(self, text_cache, font, color, first_gap=30, line_height=20):
+        self.text_cache = text_cache
+        self.font = font
+        self.color = color
+        self.first_gap = first_gap
+        self.line_height = line_height
+        self._key = None
+        self._surface = None
+
+    def get_surface(self, title, highscores, size):
+        key = (title, tuple(highscores), tuple(size))
+        if key != self._key:
+            self._surface = self._render(title, highscores, size)
+            self._key = key
+        return self._surface
+
+    def _render(self, title, highscores, size):
+        panel = pygame.Surface(size)
+        panel.fill((0, 0, 0))
+        panel.blit(self.text_cache.render(self.font, title, self.color), (0, 0))
+        y = self.first_gap
+        for i, (n, s) in enumerate(highscores, start=1):
+            panel.blit(self.text_cache.render(self.font, f"{i}. {n} - {s}", self.color), (0, y))
+            y += self.line_height
+        return panel
+
+    def draw(self, surface, title, highscores, x, y):
+        """Blit panel ke surface pada posisi (x, y), mengisi sisa area sampai tepi kanan/bawah."""
+        size = (max(surface.get_width() - x, 1), max(surface.get_height() - y, 1))
+        return surface.blit(self.get_surface(title, highscores, size), (x, y))
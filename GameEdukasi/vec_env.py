@@ -0,0 +1,262 @@
+"""
+Banyak permainan Falling Circles sekaligus, untuk melatih bot dan balancing.
+
+VectorEnv menyimpan N permainan independen di array NumPy (posisi pemain,
+lingkaran per permainan, skor, stage, timer spawn) dan memajukan semuanya
+dengan satu panggilan step(actions). Aturannya sama dengan GameEngine
+(tabrakan swept, satu step = satu tick 60 Hz): permainan dengan seed dan
+input yang sama menghasilkan skor yang sama (dicek oleh
+"python bench_vec_env.py --verify").
+
+Lingkaran setiap permainan disimpan di ring buffer (N x capacity): lingkaran
+baru menimpa slot lingkaran tertua, yang pasti sudah keluar layar karena
+kapasitas dihitung dari waktu terlama sebuah lingkaran berada di layar.
+Hanya spawn (posisi x dari random.Random per permainan, seperti
+GameEngine.spawn_circle) yang masih berupa loop Python, dan itu hanya untuk
+permainan yang memang spawn pada tick tersebut.
+
+Contoh:
+    env = VectorEnv(1024, difficulties=["Easy", "Medium", "Hard"], seed=1)
+    obs = env.reset()
+    obs, rewards, dones, info = env.step(actions)  # actions: NO_INPUT/LEFT/RIGHT per permainan
+"""
+import math
+import random
+
+import numpy as np
+
+from engine import GameConfig, TICK_RATE, LEFT, RIGHT, DIFFICULTY_SPEED_MAP, SPAWN_RATE_MAP
+from swept import times_of_impact
+
+
+class VectorEnv:
+    """
+    N permainan yang berjalan serempak. Permainan ke-i memakai difficulty
+    difficulties[i % len(difficulties)] (spawn_rate dan speed_increment dari
+    SPAWN_RATE_MAP/DIFFICULTY_SPEED_MAP), atau config apa adanya jika
+    difficulties None.
+
+    step() mengembalikan (obs, rewards, dones, info):
+      obs      float32 (N, 2 + 3 * obs_circles), lihat observe()
+      rewards  float32 (N,): pertambahan skor, dikurangi death_penalty saat kalah
+      dones    bool (N,): game over, atau max_steps tercapai
+      info     dict berisi "score" (skor akhir step ini, sebelum reset),
+               "game_over" dan "truncated" (bool per permainan)
+    Permainan yang selesai langsung di-reset; obs-nya sudah obs permainan baru.
+    Seed permainan ke-k dari env i adalah seed + i + k * N (lihat self.seeds).
+    """
+
+    def __init__(self, num_envs, config=None, difficulties=None, seed=None, obs_circles=4,
+                 death_penalty=100.0, max_steps=None):
+        cfg = config or GameConfig()
+        if cfg.tick_rate != TICK_RATE or not cfg.swept:
+            raise ValueError(f"VectorEnv only simulates swept collision at {TICK_RATE} ticks per second")
+        if cfg.base_speed <= 0 or cfg.speed_increment < 0:
+            raise ValueError("circles must always fall (base_speed > 0, speed_increment >= 0)")
+        self.config = cfg
+        self.num_envs = n = num_envs
+        self.obs_circles = obs_circles
+        self.death_penalty = death_penalty
+        self.max_steps = max_steps
+        self.gameplay_width = cfg.width - cfg.scoreboard_width
+        self.player_y = cfg.height - cfg.player_height - 10
+
+        if difficulties is None:
+            self.difficulties = [None] * n
+            self.spawn_rate = np.full(n, cfg.spawn_rate, dtype=np.int64)
+            self.speed_increment = np.full(n, cfg.speed_increment, dtype=np.int64)
+        else:
+            self.difficulties = [difficulties[i % len(difficulties)] for i in range(n)]
+            self.spawn_rate = np.array([SPAWN_RATE_MAP[d] for d in self.difficulties], dtype=np.int64)
+            self.speed_increment = np.array([DIFFICULTY_SPEED_MAP[d] for d in self.difficulties],
+                                            dtype=np.int64)
+
+        # Lingkaran hidup paling lama (height + 2r) / base_speed tick, satu spawn per spawn_rate tick
+        lifetime = (cfg.height + 2 * cfg.circle_radius) / cfg.base_speed
+        self.capacity = math.ceil(lifetime / int(self.spawn_rate.min())) + 1
+        self.circle_x = np.zeros((n, self.capacity), dtype=np.float64)
+        self.circle_y = np.zeros((n, self.capacity), dtype=np.float64)
+        self.alive = np.zeros((n, self.capacity), dtype=bool)
+
+        self.player_x = np.zeros(n, dtype=np.float64)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.stage = np.ones(n, dtype=np.int64)
+        self.speed = np.zeros(n, dtype=np.float64)
+        self.next_spawn = np.zeros(n, dtype=np.int64)
+        self.spawned = np.zeros(n, dtype=np.int64)
+        self.episodes = np.zeros(n, dtype=np.int64)
+        self.seeds = np.zeros(n, dtype=np.int64)
+        self.rngs = [random.Random() for _ in range(n)]
+        self.reset(seed)
+
+    def env_config(self, i):
+        """GameConfig yang setara untuk permainan ke-i (misalnya untuk dijalankan ulang dengan GameEngine)."""
+        return GameConfig(**dict(vars(self.config), spawn_rate=int(self.spawn_rate[i]),
+                                 speed_increment=int(self.speed_increment[i])))
+
+    def reset(self, seed=None):
+        """Mulai ulang semua permainan. Jika seed None, seed acak dipilih (disimpan di self.seed)."""
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.episodes[:] = 0
+        self._reset_envs(np.arange(self.num_envs))
+        return self.observe()
+
+    def _reset_envs(self, idx):
+        """Sama dengan GameEngine.reset() untuk permainan idx."""
+        cfg = self.config
+        self.seeds[idx] = self.seed + idx + self.episodes[idx] * self.num_envs
+        for i, seed in zip(idx.tolist(), self.seeds[idx].tolist()):
+            self.rngs[i].seed(seed)
+        self.alive[idx] = False
+        self.spawned[idx] = 0
+        self.player_x[idx] = self.gameplay_width // 2 - cfg.player_width // 2
+        self.steps[idx] = 0
+        self.score[idx] = 0
+        self.stage[idx] = 1
+        self.speed[idx] = cfg.base_speed
+        self.next_spawn[idx] = self.spawn_rate[idx] - 1
+
+    def _update_stage(self, ticks):
+        new_stage = ticks // self.config.stage_threshold + 1
+        changed = new_stage != self.stage
+        if changed.any():
+            self.stage[changed] = new_stage[changed]
+            self.speed[changed] = (self.config.base_speed
+                                   + (new_stage[changed] - 1) * self.speed_increment[changed])
+
+    def _spawn(self):
+        """Lingkaran baru di permainan yang waktu spawn-nya sudah tiba (x dari RNG masing-masing)."""
+        idx = np.flatnonzero(self.next_spawn <= self.steps)
+        if len(idx) == 0:
+            return
+        r = self.config.circle_radius
+        high = self.gameplay_width - r
+        rngs = self.rngs
+        slots = self.spawned[idx] % self.capacity
+        self.circle_x[idx, slots] = [rngs[i].randint(r, high) for i in idx.tolist()]
+        self.circle_y[idx, slots] = -r
+        self.alive[idx, slots] = True
+        self.spawned[idx] += 1
+        self.next_spawn[idx] += self.spawn_rate[idx]
+
+    def _sweep(self, rows, left0, left1, ticks0, ticks1):
+        """
+        ObstaclePool.sweep() untuk permainan rows sekaligus (semua argumen array per baris).
+        Mengembalikan s tabrakan pertama per baris (inf jika tidak menabrak).
+        """
+        cfg = self.config
+        top = self.player_y
+        radius = cfg.circle_radius
+        speed = self.speed[rows]
+        # Broad-phase pita-y yang diperlebar sejauh gerak lingkaran, seperti ObstaclePool.sweep()
+        y = self.circle_y[rows]
+        near = (self.alive[rows] & (y >= (top - radius - speed * ticks1)[:, None])
+                & (y <= (top + cfg.player_height + radius - speed * ticks0)[:, None]))
+        first = np.full(len(rows), np.inf)
+        local, cols = np.nonzero(near)
+        if len(local) == 0:
+            return first
+        v = speed[local]
+        toi = times_of_impact(self.circle_x[rows[local], cols] - left0[local],
+                              y[local, cols] + v * ticks0[local] - top, radius,
+                              left0[local] - left1[local], v * (ticks1[local] - ticks0[local]),
+                              0.0, 0.0, cfg.player_width, cfg.player_height)
+        np.minimum.at(first, local, toi)
+        return first
+
+    def step(self, actions):
+        """Satu tick untuk semua permainan; actions berupa bit LEFT/RIGHT per permainan (atau satu nilai)."""
+        cfg = self.config
+        n = self.num_envs
+        actions = np.broadcast_to(np.asarray(actions), (n,))
+        prev_score = self.score.copy()
+        t = self.steps.astype(np.float64)
+        t1 = t + 1.0
+
+        self._update_stage(self.steps)
+        self._spawn()
+
+        # Gerak pemain selama tick ini, berhenti di dinding yang dituju (lihat GameEngine._step_swept)
+        direction = ((actions & RIGHT) != 0).astype(np.int64) - ((actions & LEFT) != 0)
+        velocity = direction * cfg.player_speed
+        x0 = self.player_x
+        x1 = x0 + velocity * 1.0
+        wall = np.where(direction > 0, np.maximum(self.gameplay_width - cfg.player_width, x0),
+                        np.minimum(0, x0))
+        clipped = (direction != 0) & ((x1 - wall) * direction > 0)
+        wall_time = t1.copy()
+        if clipped.any():
+            wall_time[clipped] = t[clipped] + (wall[clipped] - x0[clipped]) / velocity[clipped]
+            x1 = np.where(clipped, wall, x1)
+        span = wall_time - t
+
+        everyone = np.arange(n)
+        s = self._sweep(everyone, x0, x1, np.zeros(n), span)
+        hit = s <= 1.0
+        hit_time = np.full(n, np.inf)
+        hit_time[hit] = t[hit] + s[hit] * span[hit]
+        # Sisa tick setelah pemain menyentuh dinding: pemain diam, lingkaran terus bergerak
+        rest = np.flatnonzero(~hit & (wall_time < t1))
+        if len(rest):
+            s = self._sweep(rest, x1[rest], x1[rest], span[rest], np.ones(len(rest)))
+            rest = rest[s <= 1.0]
+            s = s[s <= 1.0]
+            hit[rest] = True
+            hit_time[rest] = wall_time[rest] + s * (t1[rest] - wall_time[rest])
+        if cfg.invulnerable:
+            hit[:] = False
+
+        self.circle_y += self.speed[:, None]
+        self.alive &= self.circle_y - cfg.circle_radius < cfg.height
+        self.player_x = x1
+        self.steps += 1
+        self.score = np.where(hit, np.floor(hit_time, where=hit, out=np.zeros(n)), self.steps).astype(np.int64)
+        self._update_stage(self.score)
+
+        rewards = (self.score - prev_score).astype(np.float32)
+        rewards[hit] -= self.death_penalty
+        truncated = ~hit & (self.steps >= self.max_steps) if self.max_steps else np.zeros(n, dtype=bool)
+        dones = hit | truncated
+        info = {"score": self.score.copy(), "game_over": hit, "truncated": truncated}
+        if dones.any():
+            idx = np.flatnonzero(dones)
+            self.episodes[idx] += 1
+            self._reset_envs(idx)
+        return self.observe(), rewards, dones, info
+
+    def observe(self):
+        """
+        Observasi per permainan (float32):
+          [0]  posisi pemain, 0 = dinding kiri, 1 = dinding kanan
+          [1]  kecepatan lingkaran (pecahan tinggi layar per tick)
+          lalu untuk obs_circles lingkaran terdekat yang belum melewati pemain (paling bawah dulu):
+          jarak x ke tengah pemain / lebar area, jarak y ke atas pemain / tinggi layar, 1 (0 jika tidak ada)
+        """
+        cfg = self.config
+        n, m = self.num_envs, self.obs_circles
+        obs = np.zeros((n, 2 + 3 * m), dtype=np.float32)
+        obs[:, 0] = self.player_x / (self.gameplay_width - cfg.player_width)
+        obs[:, 1] = self.speed / cfg.height
+        if m == 0:
+            return obs
+        # Kecepatan semua lingkaran satu permainan sama, jadi urutan spawn = urutan y (tertua paling bawah):
+        # yang belum lewat adalah lingkaran terbaru, dan yang paling bawah di antaranya ada di slot
+        # spawned - ahead, spawned - ahead + 1, ...
+        ahead = self.alive & (self.circle_y - cfg.circle_radius < self.player_y + cfg.player_height)
+        count = np.count_nonzero(ahead, axis=1)
+        k = np.arange(m)
+        slots = (self.spawned - count)[:, None] + k
+        slots %= self.capacity
+        rows = np.arange(n)[:, None]
+        present = k < count[:, None]
+        x = self.circle_x[rows, slots]
+        y = self.circle_y[rows, slots]
+        circles = obs[:, 2:].reshape(n, m, 3)
+        circles[..., 0] = np.where(present, (x - (self.player_x + cfg.player_width / 2)[:, None])
+                                   / self.gameplay_width, 0.0)
+        circles[..., 1] = np.where(present, (self.player_y - y) / cfg.height, 0.0)
+        circles[..., 2] = present
+        return obs
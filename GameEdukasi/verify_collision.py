@@ -0,0 +1,121 @@
+"""
+Verifikasi cek tabrakan ObstaclePool terhadap circle_rectangle_collision()
+(versi asli dari Game_Edukasi.py, di bench_collision.py) sebagai referensi.
+
+1. Lapangan acak di sekitar pemain (banyak yang menabrak), dibuat dengan
+   urutan spawn (y menurun, kecepatan sama) sehingga collides() memakai
+   broad-phase pita-y, dan versi acak urutannya (tanpa broad-phase).
+   collision_mask() harus sama per lingkaran, collides() dan broad-phase grid
+   harus sama dengan any() referensi.
+2. Kasus tepi: lingkaran tepat menyentuh sisi dan sudut persegi (jarak = r,
+   tidak menabrak karena perbandingannya <) dan sedikit lebih dekat (menabrak).
+
+Keluar dengan status 1 jika ada yang tidak cocok.
+
+Contoh:
+    python verify_collision.py
+    python verify_collision.py --fields 5000 --seed 7
+"""
+import argparse
+import random
+import sys
+
+import pygame
+
+from bench_collision import circle_rectangle_collision, grid_collides
+from broadphase import UniformGrid
+from obstacles import ObstaclePool
+
+
+def make_pool(circles, velocity=4):
+    pool = ObstaclePool()
+    for c in circles:
+        pool.spawn(c['x'], c['y'], c['radius'], velocity)
+    return pool
+
+
+def check_pool(pool, circles, rect, grid, label):
+    """Mengembalikan 1 jika pool tidak cocok dengan referensi untuk rect, 0 jika cocok."""
+    expected = [circle_rectangle_collision(c, rect) for c in circles]
+    mask = pool.collision_mask(rect.left, rect.top, rect.right, rect.bottom)
+    ok = (mask.tolist() == expected and pool.collides_rect(rect) == any(expected)
+          and grid_collides(grid, pool, rect) == any(expected)) if circles else not pool.collides_rect(rect)
+    if not ok:
+        print(f"  mismatch ({label}): rect={rect} circles={circles} mask={mask.tolist()} expected={expected}")
+    return 0 if ok else 1
+
+
+def check_random_fields(fields, seed):
+    rng = random.Random(seed)
+    rect = pygame.Rect(265, 540, 50, 50)
+    grid = UniformGrid(64)
+    errors = sorted_checks = hits = 0
+    for _ in range(fields):
+        count = rng.randint(0, 12)
+        radius = rng.choice((5, 20, 40))
+        # Pusat di sekitar pemain (sampai 4 radius di luar persegi), y menurun seperti urutan spawn
+        ys = sorted((rng.uniform(rect.top - 4 * radius, rect.bottom + 4 * radius) for _ in range(count)),
+                    reverse=True)
+        circles = [{'x': rng.uniform(rect.left - 4 * radius, rect.right + 4 * radius), 'y': y, 'radius': radius}
+                   for y in ys]
+        hits += any(circle_rectangle_collision(c, rect) for c in circles)
+        pool = make_pool(circles)
+        sorted_checks += pool.y_sorted
+        errors += check_pool(pool, circles, rect, grid, "spawn order")
+        rng.shuffle(circles)
+        errors += check_pool(make_pool(circles), circles, rect, grid, "shuffled")
+    print(f"random fields: {fields} fields ({hits} with a hit, {sorted_checks} via y-band), {errors} errors")
+    return errors
+
+
+def edge_cases(rect):
+    """(lingkaran, deskripsi) tepat menyentuh dan sedikit menembus setiap sisi dan sudut."""
+    cases = []
+    for r in (5, 10, 20):
+        for name, x, y in (("left", rect.left - r, rect.centery), ("right", rect.right + r, rect.centery),
+                           ("top", rect.centerx, rect.top - r), ("bottom", rect.centerx, rect.bottom + r)):
+            cases.append(({'x': x, 'y': y, 'radius': r}, f"{name} edge touching r={r}"))
+            cases.append(({'x': x + (1 if x < rect.left else -1 if x > rect.right else 0),
+                           'y': y + (1 if y < rect.top else -1 if y > rect.bottom else 0), 'radius': r},
+                          f"{name} edge overlapping r={r}"))
+        # Sudut: segitiga 3-4-5 sehingga jarak ke sudut tepat r
+        dx, dy = 3 * r // 5, 4 * r // 5
+        for name, cx, cy, sx, sy in (("top-left", rect.left, rect.top, -1, -1),
+                                     ("top-right", rect.right, rect.top, 1, -1),
+                                     ("bottom-left", rect.left, rect.bottom, -1, 1),
+                                     ("bottom-right", rect.right, rect.bottom, 1, 1)):
+            cases.append(({'x': cx + sx * dx, 'y': cy + sy * dy, 'radius': r}, f"{name} corner touching r={r}"))
+            cases.append(({'x': cx + sx * dx, 'y': cy + sy * dy, 'radius': r + 1},
+                          f"{name} corner overlapping r={r + 1}"))
+    return cases
+
+
+def check_edges():
+    rect = pygame.Rect(265, 540, 50, 50)
+    grid = UniformGrid(64)
+    errors = 0
+    cases = edge_cases(rect)
+    for circle, label in cases:
+        expected = "overlapping" in label
+        if circle_rectangle_collision(circle, rect) != expected:
+            errors += 1
+            print(f"  reference disagrees with case {label}")
+        errors += check_pool(make_pool([circle]), [circle], rect, grid, label)
+    print(f"edges and corners: {len(cases)} cases, {errors} errors")
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifikasi cek tabrakan ObstaclePool terhadap referensi.")
+    parser.add_argument("--fields", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    errors = check_random_fields(args.fields, args.seed)
+    errors += check_edges()
+    print("OK" if errors == 0 else f"FAILED ({errors})")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
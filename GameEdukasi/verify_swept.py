@@ -0,0 +1,165 @@
+"""
+Verifikasi tabrakan kontinu (swept.py) dan kesamaan hasil antar tick rate.
+
+1. time_of_impact() dan times_of_impact() dibandingkan satu sama lain dan
+   dengan sampling rapat lintasan untuk kasus acak.
+2. Contoh tunneling: lingkaran cepat melewati pemain di antara dua tick
+   (cek diskret tidak melihatnya, swept melihatnya).
+3. Permainan acak dengan kecepatan tinggi dijalankan dengan swept pada
+   --rates (default 30, 60, 120, 240 Hz) dengan input yang ditahan sama lama.
+   Skor, tick game over dan posisi lingkaran saat tabrakan harus sama persis
+   dengan rate tertinggi (referensi). Sebagai pembanding, tabrakan diskret
+   lama pada rate yang sama dihitung berapa kali hasilnya berbeda.
+
+Keluar dengan status 1 jika ada yang tidak cocok.
+
+Contoh:
+    python verify_swept.py
+    python verify_swept.py --games 500 --rates 30 240
+"""
+import argparse
+import math
+import random
+import sys
+from fractions import Fraction
+
+import numpy as np
+
+from engine import GameConfig, GameEngine, NO_INPUT, LEFT, RIGHT, TICK_RATE
+from swept import time_of_impact, times_of_impact
+
+
+def inside(px, py, r, left, top, right, bottom):
+    dx = px - min(max(px, left), right)
+    dy = py - min(max(py, top), bottom)
+    return dx * dx + dy * dy < r * r
+
+
+def check_primitives(cases, samples, seed):
+    """Mengembalikan jumlah kasus yang salah."""
+    rng = random.Random(seed)
+    left, top, right, bottom = 0.0, 0.0, 50.0, 50.0
+    cx, cy, r, dx, dy = (np.empty(cases) for _ in range(5))
+    for i in range(cases):
+        r[i] = rng.choice((5.0, 20.0, 40.0))
+        cx[i] = rng.uniform(-150, 200)
+        cy[i] = rng.uniform(-250, 150)
+        dx[i] = rng.choice((0.0, rng.uniform(-120, 120)))
+        dy[i] = rng.choice((0.0, rng.uniform(0, 250), rng.uniform(-50, 250)))
+    batch = times_of_impact(cx, cy, r, dx, dy, left, top, right, bottom)
+    errors = 0
+    hits = 0
+    for i in range(cases):
+        args = (cx[i], cy[i], r[i], dx[i], dy[i])
+        toi = time_of_impact(*args, left, top, right, bottom)
+        first = next((k / samples for k in range(samples + 1)
+                      if inside(cx[i] + dx[i] * k / samples, cy[i] + dy[i] * k / samples, r[i],
+                                left, top, right, bottom)), math.inf)
+        ok = toi == batch[i] or abs(toi - batch[i]) < 1e-12
+        # Sampling hanya bisa terlambat menemukan tabrakan, tidak pernah lebih awal
+        ok = ok and toi <= first + 1e-9
+        if toi <= 1.0:
+            hits += 1
+            # Titik tabrakan berada di tepi daerah "jarak < r" (atau di dalamnya jika s = 0)
+            px, py = cx[i] + dx[i] * toi, cy[i] + dy[i] * toi
+            ex = px - min(max(px, left), right)
+            ey = py - min(max(py, top), bottom)
+            dist = math.hypot(ex, ey)
+            ok = ok and (dist <= r[i] + 1e-6 and (toi == 0.0 or dist >= r[i] - 1e-6))
+        if not ok:
+            errors += 1
+            print(f"  mismatch: circle={args} toi={toi} batch={batch[i]} sampled={first}")
+    print(f"primitives: {cases} cases, {hits} hits, {errors} errors")
+    return errors
+
+
+def check_tunneling():
+    """Lingkaran r=20 bergerak 150 px per tick melewati pemain 50x50."""
+    left, top, right, bottom = 100.0, 500.0, 150.0, 550.0
+    cx, cy, r, dy = 125.0, 440.0, 20.0, 150.0
+    discrete = inside(cx, cy + dy, r, left, top, right, bottom)
+    toi = time_of_impact(cx, cy, r, 0.0, dy, left, top, right, bottom)
+    print(f"tunneling: discrete hit={discrete}, swept hit={toi <= 1.0} at s={toi:.3f}")
+    return 0 if (not discrete and toi <= 1.0) else 1
+
+
+def stress_config(tick_rate, swept):
+    """Kecepatan naik cepat (stage setiap 300 tick) agar lingkaran jauh lebih cepat dari ukuran pemain."""
+    return GameConfig(width=800, height=600, scoreboard_width=220, player_speed=7, base_speed=4,
+                      speed_increment=6, spawn_rate=25, stage_threshold=300,
+                      tick_rate=tick_rate, swept=swept)
+
+
+def input_schedule(seed, length):
+    """Input per 1/input_rate detik: kiri/kanan/diam ditahan 3-20 langkah."""
+    rng = random.Random(seed)
+    schedule = []
+    while len(schedule) < length:
+        schedule += [rng.choice((NO_INPUT, LEFT, RIGHT))] * rng.randint(3, 20)
+    return schedule[:length]
+
+
+def play(seed, tick_rate, swept, schedule, input_rate, max_seconds):
+    engine = GameEngine(stress_config(tick_rate, swept), seed)
+    for step in range(max_seconds * tick_rate):
+        if engine.step(schedule[step * input_rate // tick_rate]):
+            break
+    # Lingkaran yang sudah keluar layar baru dihapus di akhir step, jadi hanya yang masih di layar dibandingkan
+    pool = engine.obstacles
+    n = pool.count
+    on_screen = pool.y[:n] - pool.radius[:n] < engine.height
+    return engine.score, engine.game_over, np.sort(pool.y[:n][on_screen]), engine.player_x
+
+
+def check_rates(games, rates, max_seconds, seed):
+    reference_rate = max(rates)
+    input_rate = min(rates)
+    mismatches = {rate: 0 for rate in rates}
+    discrete_diff = {rate: 0 for rate in rates}
+    for game in range(games):
+        game_seed = seed + game
+        schedule = input_schedule(game_seed, max_seconds * input_rate)
+        reference = play(game_seed, reference_rate, True, schedule, input_rate, max_seconds)
+        for rate in rates:
+            result = reference if rate == reference_rate else play(game_seed, rate, True, schedule,
+                                                                   input_rate, max_seconds)
+            same = (result[:2] == reference[:2] and len(result[2]) == len(reference[2])
+                    and np.allclose(result[2], reference[2], rtol=0, atol=1e-6)
+                    and abs(result[3] - reference[3]) < 1e-6)
+            if not same:
+                mismatches[rate] += 1
+                print(f"  seed {game_seed} @ {rate} Hz: score {result[0]} vs {reference[0]} @ {reference_rate} Hz")
+            discrete = play(game_seed, rate, False, schedule, input_rate, max_seconds)
+            discrete_diff[rate] += discrete[:2] != reference[:2]
+
+    print(f"\n{games} games, inputs held per 1/{input_rate} s, reference = swept @ {reference_rate} Hz")
+    print(f"{'rate':>6}{'swept mismatches':>18}{'discrete differs':>18}")
+    for rate in rates:
+        print(f"{rate:>4}Hz{mismatches[rate]:>18}{discrete_diff[rate]:>18}")
+    return sum(mismatches.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifikasi tabrakan swept dan kesamaan antar tick rate.")
+    parser.add_argument("--cases", type=int, default=2000, help="kasus acak untuk time_of_impact")
+    parser.add_argument("--samples", type=int, default=2000, help="titik sampling per lintasan")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--rates", nargs="+", type=int, default=[30, 60, 120, 240])
+    parser.add_argument("--max-seconds", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    for rate in args.rates:
+        # Panjang step harus pecahan biner (tepat di float) dan input harus bisa ditahan sama lama
+        step = Fraction(TICK_RATE, rate).denominator
+        if step & (step - 1) or rate % min(args.rates):
+            parser.error(f"rate {rate} must be a multiple of {min(args.rates)} with an exact step length")
+
+    errors = check_primitives(args.cases, args.samples, args.seed)
+    errors += check_tunneling()
+    errors += check_rates(args.games, args.rates, args.max_seconds, args.seed)
+    print("OK" if errors == 0 else f"FAILED ({errors})")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())